@@ -0,0 +1,153 @@
+"""
+Runs a million random macro ops with each way the machine has of dispatching
+them, to track the number of ops run per second.
+
+Usage: python -m benchmarks.dispatch [--ops count] [--modes name ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import random
+import time
+import typing
+
+from marrow.compiler.backend.funcs import BinaryArithmeticFunc
+from marrow.compiler.backend.funcs import UnaryArithmeticFunc
+from marrow.compiler.backend.macro.ops import BinaryArithmetic
+from marrow.compiler.backend.macro.ops import BinaryArithmeticImmediate
+from marrow.compiler.backend.macro.ops import Load
+from marrow.compiler.backend.macro.ops import LoadImmediate
+from marrow.compiler.backend.macro.ops import Store
+from marrow.compiler.backend.macro.ops import StoreImmediate
+from marrow.compiler.backend.macro.ops import UnaryArithmetic
+from marrow.compiler.common import Bytecode
+from marrow.compiler.common import MacroOp
+from marrow.runtime.constants import REGISTER_INDEXES
+from marrow.runtime.machine import Machine
+from marrow.tooling import GlobalTooling
+from marrow.types import ImmediateType
+from marrow.types import RegisterNumber
+
+# the keyword arguments of the machine, and the method running its instructions
+MODE_MAPPING: dict[
+    str,
+    tuple[dict[str, bool], collections.abc.Callable[[Machine], None]],
+] = {
+    "visiting": ({}, Machine.run_visiting),
+    "threaded": ({}, Machine.run_threaded),
+    "integer": ({"integer_registers": True}, Machine.run_threaded),
+    "jit": ({"jit": True}, Machine.run_compiled),
+}
+
+REGISTERS = typing.cast("tuple[RegisterNumber, ...]", REGISTER_INDEXES)
+VALUES = (0, 1, 5, 2**63, 2**64 - 1)
+
+
+def make_ops(tooling: GlobalTooling, count: int) -> list[MacroOp]:
+    """
+    Parameters
+    ----------
+    tooling : GlobalTooling
+    count : int
+        The number of macro ops.
+
+    Returns
+    -------
+    list[MacroOp]
+        Random macro ops, the same on every run, moving integers between a
+        few registers and heap slots and computing with them.
+    """
+
+    rng = random.Random(0)
+    immediates = [tooling.endec.encode_immediate(value) for value in VALUES]
+    ops: list[MacroOp] = []
+
+    for _ in range(count):
+        roll = rng.random()
+        register = rng.choice(REGISTERS)
+        location = rng.randint(0, 50)
+        immediate = rng.choice(immediates)
+
+        if roll < 0.2:
+            ops.append(Load(register, location))
+        elif roll < 0.4:
+            ops.append(Store(location, register))
+        elif roll < 0.5:
+            ops.append(StoreImmediate(location, ImmediateType.INTEGER, immediate))
+        elif roll < 0.65:
+            ops.append(
+                BinaryArithmetic(
+                    rng.choice(list(BinaryArithmeticFunc)),
+                    ImmediateType.INTEGER,
+                    register,
+                    rng.choice(REGISTERS),
+                    rng.choice(REGISTERS),
+                ),
+            )
+        elif roll < 0.75:
+            ops.append(LoadImmediate(register, ImmediateType.INTEGER, immediate))
+        elif roll < 0.88:
+            ops.append(
+                BinaryArithmeticImmediate(
+                    rng.choice(list(BinaryArithmeticFunc)),
+                    ImmediateType.INTEGER,
+                    register,
+                    rng.choice(REGISTERS),
+                    immediate,
+                ),
+            )
+        else:
+            ops.append(
+                UnaryArithmetic(
+                    rng.choice(list(UnaryArithmeticFunc)),
+                    ImmediateType.INTEGER,
+                    register,
+                    rng.choice(REGISTERS),
+                ),
+            )
+
+    return ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="run random macro ops")
+    parser.add_argument(
+        "--ops",
+        type=int,
+        default=1_000_000,
+        help="the number of macro ops (default: 1000000)",
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=list(MODE_MAPPING),
+        default=list(MODE_MAPPING),
+    )
+    args = parser.parse_args()
+
+    tooling = GlobalTooling.new(verbose=False)
+    # the overflow warnings are not shown, so that only dispatching is measured
+    tooling.logger.warn = lambda message, *, source_path=None: None
+
+    bytecode = Bytecode("<benchmark>", 0, make_ops(tooling, args.ops))
+
+    for name in args.modes:
+        options, run = MODE_MAPPING[name]
+        machine = Machine(tooling, **options)
+        machine.load_bytecode(bytecode)
+
+        time_start = time.perf_counter()
+        run(machine)
+        time_end = time.perf_counter()
+
+        duration = time_end - time_start
+        print(
+            f"{name:>8}: {args.ops} ops in {duration:.2f}s, "
+            f"{args.ops / duration:,.0f} ops/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
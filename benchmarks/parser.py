@@ -0,0 +1,51 @@
+"""
+Parses a block of `1 + 2;` statements, to track the number of tokens parsed
+per second.
+
+Usage: python -m benchmarks.parser [--statements count] [--iterative]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+from marrow.compiler.components import BufferedTokenizer
+from marrow.compiler.components import Parser
+from marrow.tooling import GlobalTooling
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="parse a block of statements")
+    parser.add_argument(
+        "--statements",
+        type=int,
+        default=1_000_000,
+        help="the number of statements of the block (default: 1000000)",
+    )
+    parser.add_argument(
+        "--iterative",
+        action="store_true",
+        help="use the explicit-stack parse mode",
+    )
+    args = parser.parse_args()
+
+    source = "mod in\n" + "    1 + 2;\n" * args.statements + "end\n"
+
+    # the tokens are scanned beforehand, so that only parsing is measured
+    # (tokens are still built from the compact stream while parsing)
+    tokens = BufferedTokenizer(io.StringIO(source)).run_compact()
+    count = len(tokens)
+    tooling = GlobalTooling.new(verbose=False)
+
+    time_start = time.perf_counter()
+    Parser(iter(tokens), tooling, iterative=args.iterative).run()
+    time_end = time.perf_counter()
+
+    duration = time_end - time_start
+    print(f"{count} tokens in {duration:.2f}s, {count / duration:,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Tokenizes sources of `1 + 2;` lines of growing sizes, to check that the time
+taken is proportional to the size.
+
+Usage: python -m benchmarks.tokenizer [--tokenizer name] [--size megabytes]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+from marrow.compiler.common import TokenType
+from marrow.compiler.options import TOKENIZER_MAPPING
+
+LINE = "1 + 2;\n"
+
+
+def make_source(size: int) -> str:
+    """
+    Parameters
+    ----------
+    size : int
+        The approximate size of the source, in bytes.
+
+    Returns
+    -------
+    str
+        A block of `1 + 2;` lines.
+    """
+
+    return "mod in\n" + LINE * (size // len(LINE)) + "end\n"
+
+
+def measure(tokenizer_name: str, source: str) -> tuple[int, float]:
+    """
+    Parameters
+    ----------
+    tokenizer_name : str
+    source : str
+
+    Returns
+    -------
+    tuple[int, float]
+        The number of tokens produced, and the time taken, in seconds.
+    """
+
+    tokenizer = TOKENIZER_MAPPING[tokenizer_name](io.StringIO(source))
+
+    time_start = time.perf_counter()
+    count = 0
+
+    # the tokens are counted, not kept, so that memory does not grow
+    for token in tokenizer.run():
+        count += 1
+
+        # the tokenizer yields end-of-file tokens forever
+        if token.type is TokenType.EOF:
+            break
+
+    time_end = time.perf_counter()
+
+    return count, time_end - time_start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="tokenize sources of growing sizes",
+    )
+    parser.add_argument(
+        "--tokenizer",
+        choices=list(TOKENIZER_MAPPING),
+        default="stream",
+    )
+    parser.add_argument(
+        "--size",
+        type=float,
+        default=10,
+        help="the size of the biggest source, in megabytes (default: 10)",
+    )
+    args = parser.parse_args()
+
+    biggest_size = int(args.size * 1024 * 1024)
+    durations: dict[int, float] = {}
+
+    for divisor in (8, 4, 2, 1):
+        size = biggest_size // divisor
+        count, duration = measure(args.tokenizer, make_source(size))
+        durations[size] = duration
+
+        print(
+            f"{size / 1024 / 1024:6.2f} MB: {count:>9} tokens in {duration:.2f}s, "
+            f"{count / duration:,.0f} tokens/s",
+        )
+
+    # linear scaling keeps the time per byte about constant
+    smallest_size, smallest_duration = next(iter(durations.items()))
+    ratio = (durations[biggest_size] / biggest_size) / (
+        smallest_duration / smallest_size
+    )
+    print(f"time per byte, biggest vs smallest source: {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
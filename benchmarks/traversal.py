@@ -0,0 +1,67 @@
+"""
+Walks a parse tree of about a million nodes with each pass built on the
+traversals of the AST, to track the number of nodes visited per second.
+
+Usage: python -m benchmarks.traversal [--nodes count] [--passes name ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import io
+import time
+
+from marrow.compiler.components import BufferedTokenizer
+from marrow.compiler.components import IRGenerator
+from marrow.compiler.components import Parser
+from marrow.compiler.components import ParseTreeSanityChecker
+from marrow.compiler.frontend.ast import expr
+from marrow.compiler.renderers import ParseTreeRenderer
+from marrow.tooling import GlobalTooling
+
+PASS_MAPPING: dict[str, collections.abc.Callable[[expr.Expr], object]] = {
+    "sanity": lambda tree: ParseTreeSanityChecker().is_sane(tree),
+    "ir": lambda tree: IRGenerator().generate(tree),
+    "render": lambda tree: ParseTreeRenderer().render(tree),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="walk a parse tree")
+    parser.add_argument(
+        "--nodes",
+        type=int,
+        default=1_000_000,
+        help="the approximate number of nodes of the tree (default: 1000000)",
+    )
+    parser.add_argument(
+        "--passes",
+        nargs="+",
+        choices=list(PASS_MAPPING),
+        default=list(PASS_MAPPING),
+    )
+    args = parser.parse_args()
+
+    # a module and its block, then a binary node and two literals per statement
+    statements = max(1, (args.nodes - 2) // 3)
+    count = 2 + 3 * statements
+
+    source = "mod in\n" + "    1 + 2;\n" * statements + "end\n"
+    tooling = GlobalTooling.new(verbose=False)
+    tree = Parser(BufferedTokenizer(io.StringIO(source)).run(), tooling).run()
+
+    for name in args.passes:
+        time_start = time.perf_counter()
+        PASS_MAPPING[name](tree)
+        time_end = time.perf_counter()
+
+        duration = time_end - time_start
+        print(
+            f"{name:>6}: {count} nodes in {duration:.2f}s, "
+            f"{count / duration:,.0f} nodes/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
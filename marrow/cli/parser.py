@@ -35,12 +35,43 @@ class FakeFileType:
         return file  # pyright: ignore[reportReturnType]
 
 
+def positive_int(value: str) -> int:
+    """
+    Parameters
+    ----------
+    value : str
+        The value of the flag, as given on the command line.
+
+    Returns
+    -------
+    int
+        The value, converted.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the value is not a strictly positive integer.
+    """
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive int, got {number}")
+
+    return number
+
+
 class CLIParser:
     def __init__(self) -> None:
         self._parser = argparse.ArgumentParser()
         self.subparsers = self._parser.add_subparsers(dest="command")
 
         self._global_flags_parent = self.get_global_flags_parent()
+        self._compiler_flags_parent = self.get_compiler_flags_parent()
+        self._runtime_flags_parent = self.get_runtime_flags_parent()
         self._source_parent = self.get_source_parent()
 
     def get_global_flags_parent(self) -> argparse.ArgumentParser:
@@ -61,6 +92,98 @@ class CLIParser:
 
         return parent
 
+    def get_compiler_flags_parent(self) -> argparse.ArgumentParser:
+        parent = argparse.ArgumentParser(add_help=False)
+        parent.add_argument(
+            "--tokenizer",
+            choices=["stream", "buffered", "regex"],
+            default="buffered",
+            help="the tokenizer implementation to use",
+        )
+        parent.add_argument(
+            "--compact-tokens",
+            action="store_true",
+            help="tokenize the whole source at once into a compact token stream",
+        )
+        parent.add_argument(
+            "--iterative-parser",
+            action="store_true",
+            help="parse without recursion, to support deeply nested expressions",
+        )
+        parent.add_argument(
+            "--max-errors",
+            type=positive_int,
+            default=None,
+            help="stop compiling after this many errors",
+            metavar="n",
+        )
+        parent.add_argument(
+            "-O",
+            type=int,
+            choices=[0, 1, 2],
+            default=2,
+            dest="optimization_level",
+            help="the optimization level (default: 2)",
+            metavar="level",
+        )
+        parent.add_argument(
+            "--no-constant-folding",
+            action="store_false",
+            dest="fold_constants",
+            help="do not evaluate the arithmetic on literals at compile time",
+        )
+        parent.add_argument(
+            "--no-cse",
+            action="store_false",
+            dest="eliminate_common_subexpressions",
+            help="do not eliminate the values computed several times",
+        )
+        parent.add_argument(
+            "--no-dce",
+            action="store_false",
+            dest="eliminate_dead_code",
+            help="compute the values that are never used (always the case with --debug)",
+        )
+        parent.add_argument(
+            "--no-heap-compaction",
+            action="store_false",
+            dest="compact_heap",
+            help="store each value at its own heap slot (always the case with --debug)",
+        )
+        parent.add_argument(
+            "--no-peephole",
+            action="store_false",
+            dest="peephole",
+            help="do not remove the redundant loads and stores of the macro ops",
+        )
+        parent.add_argument(
+            "--packed-ir",
+            action="store_true",
+            help="pack the SSA IR into arrays before lowering it to macro ops",
+        )
+
+        return parent
+
+    def get_runtime_flags_parent(self) -> argparse.ArgumentParser:
+        parent = argparse.ArgumentParser(add_help=False)
+        parent.add_argument(
+            "--jit",
+            action="store_true",
+            help="compile the macro ops to Python before running them (ignored with --debug)",
+        )
+        parent.add_argument(
+            "--integer-registers",
+            action="store_true",
+            help="hold registers as integers rather than bytes",
+        )
+        parent.add_argument(
+            "--profile-memory",
+            action="store_true",
+            help="show the memory allocated per macro op (ignored with --debug)",
+        )
+
+        return parent
+
     def get_source_parent(self) -> argparse.ArgumentParser:
         parent = argparse.ArgumentParser(add_help=False)
         parent.add_argument(
@@ -86,7 +209,11 @@ class CLIParser:
         parser = self.subparsers.add_parser(
             "compile",
             help="compile marrow code without running it",
-            parents=[self._global_flags_parent, self._source_parent],
+            parents=[
+                self._global_flags_parent,
+                self._compiler_flags_parent,
+                self._source_parent,
+            ],
         )
 
         return parser
@@ -95,7 +222,12 @@ class CLIParser:
         parser = self.subparsers.add_parser(
             "run",
             help="run marrow code",
-            parents=[self._global_flags_parent, self._source_parent],
+            parents=[
+                self._global_flags_parent,
+                self._compiler_flags_parent,
+                self._runtime_flags_parent,
+                self._source_parent,
+            ],
         )
 
         return parser
@@ -104,7 +236,11 @@ class CLIParser:
         parser = self.subparsers.add_parser(
             "shell",
             help="start the interactive interpreter",
-            parents=[self._global_flags_parent],
+            parents=[
+                self._global_flags_parent,
+                self._compiler_flags_parent,
+                self._runtime_flags_parent,
+            ],
         )
 
         return parser
@@ -121,7 +257,25 @@ class CLIParser:
         ]
 
     def get_base_namespace(self) -> argparse.Namespace:
-        return argparse.Namespace(source=io.StringIO(), verbose=False, debug=False)
+        return argparse.Namespace(
+            source=io.StringIO(),
+            verbose=False,
+            debug=False,
+            tokenizer="buffered",
+            compact_tokens=False,
+            iterative_parser=False,
+            max_errors=None,
+            optimization_level=2,
+            fold_constants=True,
+            eliminate_common_subexpressions=True,
+            eliminate_dead_code=True,
+            compact_heap=True,
+            peephole=True,
+            packed_ir=False,
+            jit=False,
+            integer_registers=False,
+            profile_memory=False,
+        )
 
     def parse_args(self, args: list[str] | None = None) -> argparse.Namespace:
         self.get_main_parser()
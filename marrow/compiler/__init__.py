@@ -1,3 +1,4 @@
 from .compiler import Compiler
+from .options import CompilerOptions
 
-__all__ = ["Compiler"]
+__all__ = ["Compiler", "CompilerOptions"]
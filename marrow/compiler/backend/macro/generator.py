@@ -3,19 +3,28 @@
 from __future__ import annotations
 
 import collections.abc
+import heapq
 import io
 import typing
 
 from marrow.compiler.backend.funcs import BINOP_FUNC_MAPPING
 from marrow.compiler.backend.funcs import UNOP_FUNC_MAPPING
 from marrow.compiler.common import TokenType
+from marrow.compiler.middleend.SSAIR.numbering import COMMUTATIVE_OPERATORS
+from marrow.compiler.middleend.SSAIR.packed import BINARY_KIND_MAPPING
+from marrow.compiler.middleend.SSAIR.packed import UNARY_KIND_MAPPING
+from marrow.compiler.middleend.SSAIR.packed import IROpcode
 from marrow.compiler.middleend.SSAIR.rvalue import AtomRValue
 from marrow.compiler.middleend.SSAIR.rvalue import BinaryRValue
 from marrow.compiler.middleend.SSAIR.rvalue import UnaryRValue
+from marrow.runtime.constants import HEAP_SIZE
+from marrow.runtime.constants import REGISTER_SIZE
 from marrow.types import ImmediateType
 
 from .ops import BinaryArithmetic
+from .ops import BinaryArithmeticImmediate
 from .ops import Load
+from .ops import LoadImmediate
 from .ops import Store
 from .ops import StoreImmediate
 from .ops import UnaryArithmetic
@@ -26,6 +35,7 @@ if typing.TYPE_CHECKING:
     from marrow.compiler.common import LiteralTokenType
     from marrow.compiler.common import Token
     from marrow.compiler.common import UnaryOpTokenType
+    from marrow.compiler.middleend.SSAIR.packed import PackedIR
     from marrow.tooling import GlobalTooling
     from marrow.types import MemoryAddress
     from marrow.types import RegisterNumber
@@ -34,6 +44,25 @@ if typing.TYPE_CHECKING:
 
 
 class MacroOpGenerator:
+    """
+    Lowers the SSA IR to macro ops, allocating registers by linear scan.
+
+    The IR is straight-line code, so the live range of a location spans from
+    the instruction defining it to the last one reading it. The result of an
+    operation is kept in a register for its whole live range. When the
+    registers run out, the value whose live range ends last is spilled to its
+    heap slot, from which it is loaded back when read.
+
+    Literals are not stored: they are the immediate operand of the operations
+    reading them, or loaded as immediates when they cannot be. The values
+    that are never read are stored to the heap, as well as every value if
+    `store_all` is set.
+
+    If `compact_heap` is set, the values are stored to heap slots rather than
+    at their location, a slot being reused once the value it holds is dead.
+    The heap then holds as many slots as there are values stored at once.
+    """
+
     def __init__(self, tooling: GlobalTooling) -> None:
         self.ops: list[MacroOp] = []
         self.available_registers: list[RegisterNumber] = [
@@ -58,16 +87,159 @@ class MacroOpGenerator:
         # at the end
         self.available_registers.reverse()
 
+        # locations held in registers, and those up to date in the heap
+        self.registers: dict[MemoryAddress, RegisterNumber] = {}
+        self.stored: set[MemoryAddress] = set()
+        # literals, which are never spilled as they can be loaded again
+        self.immediates: dict[MemoryAddress, tuple[ImmediateType, bytearray]] = {}
+        # index of the last instruction reading each location
+        self.last_uses: dict[MemoryAddress, int] = {}
+        self.index = 0
+        self.store_all = False
+
+        # heap slots of the stored locations, and the slots that were freed
+        self.compact_heap = False
+        self.slots: dict[MemoryAddress, MemoryAddress] = {}
+        self.free_slots: list[MemoryAddress] = []
+        self.slot_count = 0
+
         self.tooling = tooling
 
-    def allocate_register(self) -> RegisterNumber:
+    def allocate_register(
+        self,
+        pinned: collections.abc.Container[RegisterNumber] = (),
+    ) -> RegisterNumber:
+        """
+        Parameters
+        ----------
+        pinned : Container[RegisterNumber], optional
+            The registers that must not be spilled to get a register.
+
+        Returns
+        -------
+        RegisterNumber
+            A free register, made available by spilling a value if needed.
+        """
+
         if not self.available_registers:
-            raise RuntimeError("critical error: no available registers")
+            self.spill(pinned)
 
         index = self.available_registers.pop()
 
         return index
 
+    def spill(self, pinned: collections.abc.Container[RegisterNumber]) -> None:
+        candidates = [
+            location
+            for location, register in self.registers.items()
+            if register not in pinned
+        ]
+
+        if not candidates:
+            raise RuntimeError("critical error: no available registers")
+
+        location = max(candidates, key=self.last_uses.__getitem__)
+        register = self.registers.pop(location)
+
+        if location not in self.stored and location not in self.immediates:
+            self.add_ops(Store(self.get_slot(location), register))
+            self.stored.add(location)
+
+        self.free_register(register)
+
+    def get_slot(self, location: MemoryAddress) -> MemoryAddress:
+        """
+        Parameters
+        ----------
+        location : MemoryAddress
+
+        Returns
+        -------
+        MemoryAddress
+            The heap slot of the location, the lowest free one if it has none.
+        """
+
+        if not self.compact_heap:
+            self.slot_count = max(self.slot_count, location + 1)
+
+            return location
+
+        slot = self.slots.get(location)
+
+        if slot is None:
+            if self.free_slots:
+                slot = heapq.heappop(self.free_slots)
+            else:
+                slot = self.slot_count
+                self.slot_count += 1
+
+            self.slots[location] = slot
+
+        return slot
+
+    def free_slot(self, location: MemoryAddress) -> None:
+        if location in self.slots:
+            heapq.heappush(self.free_slots, self.slots.pop(location))
+
+    def fetch(
+        self,
+        location: MemoryAddress,
+        pinned: collections.abc.Container[RegisterNumber] = (),
+    ) -> RegisterNumber:
+        """
+        Parameters
+        ----------
+        location : MemoryAddress
+            The location read by the current instruction.
+        pinned : Container[RegisterNumber], optional
+            The registers holding the other operands of the instruction.
+
+        Returns
+        -------
+        RegisterNumber
+            The register holding the value of the location, loaded if needed.
+        """
+
+        register = self.registers.get(location)
+
+        if register is None:
+            register = self.allocate_register(pinned)
+            self.registers[location] = register
+
+            if location in self.immediates:
+                self.add_ops(LoadImmediate(register, *self.immediates[location]))
+            else:
+                self.add_ops(Load(register, self.get_slot(location)))
+
+        return register
+
+    def release(self, *locations: MemoryAddress) -> None:
+        """Free the registers and slots of the locations read for the last time."""
+
+        for location in locations:
+            if self.last_uses[location] != self.index:
+                continue
+
+            if location in self.registers:
+                self.free_register(self.registers.pop(location))
+
+            self.free_slot(location)
+
+    def define(self, destination: MemoryAddress, register: RegisterNumber) -> None:
+        """Keep the result of an operation, which was written to the register."""
+
+        is_used = destination in self.last_uses
+
+        if self.store_all or not is_used:
+            self.add_ops(Store(self.get_slot(destination), register))
+            self.stored.add(destination)
+
+        if is_used:
+            self.registers[destination] = register
+        else:
+            self.free_register(register)
+            self.free_slot(destination)
+
     def free_register(self, index: RegisterNumber) -> None:
         if index in self.available_registers:
             raise ValueError(f"cannot free register {index!r}: already freed")
@@ -94,8 +266,16 @@ class MacroOpGenerator:
 
         immediate = self.tooling.endec.encode_immediate(value)
 
-        op = StoreImmediate(destination, type, immediate)
-        self.add_ops(op)
+        if destination in self.last_uses:
+            self.immediates[destination] = (type, immediate)
+
+        if self.store_all or destination not in self.last_uses:
+            op = StoreImmediate(self.get_slot(destination), type, immediate)
+            self.add_ops(op)
+            self.stored.add(destination)
+
+        if destination not in self.last_uses:
+            self.free_slot(destination)
 
     def lower_binary_op(
         self,
@@ -104,23 +284,52 @@ class MacroOpGenerator:
         left: MemoryAddress,
         right: MemoryAddress,
     ) -> None:
-        rdestination = self.allocate_register()
-        rleft = self.allocate_register()
-        rright = self.allocate_register()
-
         func = BINOP_FUNC_MAPPING[kind]
 
+        if (
+            kind in COMMUTATIVE_OPERATORS
+            and left in self.immediates
+            and right not in self.immediates
+        ):
+            left, right = right, left
+
+        if right in self.immediates:
+            (_, immediate) = self.immediates[right]
+
+            rleft = self.fetch(left)
+            self.release(left, right)
+
+            rdestination = self.allocate_register()
+
+            self.add_ops(
+                BinaryArithmeticImmediate(
+                    func,
+                    ImmediateType.INTEGER,
+                    rdestination,
+                    rleft,
+                    immediate,
+                ),
+            )
+            self.define(destination, rdestination)
+
+            return
+
+        rleft = self.fetch(left)
+        rright = self.fetch(right, (rleft,))
+        self.release(left, right)
+
+        # the operands are read before the result is written, so it can be
+        # written to the register of one of them
+        rdestination = self.allocate_register()
+
         self.add_ops(
-            Load(rleft, left),
-            Load(rright, right),
             # NOTE: in the future, the SSA IR will be produced from a typed AST
             # so we won't have to hardcode the binop type, we will just grab
             # the data from the SSA IR instruction
             BinaryArithmetic(func, ImmediateType.INTEGER, rdestination, rleft, rright),
-            Store(destination, rdestination),
         )
 
-        self.free_registers(rdestination, rleft, rright)
+        self.define(destination, rdestination)
 
     def lower_unary_op(
         self,
@@ -128,21 +337,21 @@ class MacroOpGenerator:
         destination: MemoryAddress,
         right: MemoryAddress,
     ) -> None:
+        rright = self.fetch(right)
+        self.release(right)
+
         rdestination = self.allocate_register()
-        rright = self.allocate_register()
 
         func = UNOP_FUNC_MAPPING[kind]
 
         self.add_ops(
-            Load(rright, right),
             # NOTE: in the future, the SSA IR will be produced from a typed AST
             # so we won't have to hardcode the binop type, we will just grab
             # the data from the SSA IR instruction
             UnaryArithmetic(func, ImmediateType.INTEGER, rdestination, rright),
-            Store(destination, rdestination),
         )
 
-        self.free_registers(rdestination, rright)
+        self.define(destination, rdestination)
 
     def lower(self, instruction: IRInstruction) -> None:
         match instruction.rvalue:
@@ -166,12 +375,35 @@ class MacroOpGenerator:
 
         return buffer.getvalue()
 
-    def generate(self, ir: collections.abc.Iterable[IRInstruction]) -> list[MacroOp]:
-        self.ops.clear()
+    def lower_packed(self, ir: PackedIR, index: int) -> None:
+        opcode = ir.opcodes[index]
+        destination = ir.destinations[index]
+
+        if opcode == IROpcode.ATOM:
+            self.lower_atom_op(destination, ir.constants[ir.lefts[index]])
+        elif opcode in BINARY_KIND_MAPPING:
+            self.lower_binary_op(
+                BINARY_KIND_MAPPING[IROpcode(opcode)],
+                destination,
+                ir.lefts[index],
+                ir.rights[index],
+            )
+        else:
+            self.lower_unary_op(
+                UNARY_KIND_MAPPING[IROpcode(opcode)],
+                destination,
+                ir.rights[index],
+            )
 
-        for instruction in ir:
-            self.lower(instruction)
+    def check_heap_size(self) -> None:
+        size = self.slot_count * REGISTER_SIZE
 
+        if size > HEAP_SIZE:
+            self.tooling.logger.warn(
+                f"the program uses {size} bytes of heap, more than the {HEAP_SIZE} available",
+            )
+
+    def check_freed_registers(self) -> None:
         nonfreed_registers = [
             index for index in range(1, 16) if index not in self.available_registers
         ]
@@ -181,4 +413,98 @@ class MacroOpGenerator:
                 self.generate_log_nonfreed_registers(nonfreed_registers),
             )
 
+    def reset(
+        self,
+        operands: collections.abc.Iterable[tuple[MemoryAddress, ...]],
+    ) -> None:
+        """
+        Prepare the allocation for a new SSA IR.
+
+        Parameters
+        ----------
+        operands : Iterable[tuple[MemoryAddress, ...]]
+            The locations read by each instruction of the SSA IR, in order.
+        """
+
+        self.ops.clear()
+        self.registers.clear()
+        self.stored.clear()
+        self.immediates.clear()
+        self.last_uses.clear()
+        self.slots.clear()
+        self.free_slots.clear()
+        self.slot_count = 0
+
+        for index, locations in enumerate(operands):
+            for location in locations:
+                self.last_uses[location] = index
+
+    def generate(
+        self,
+        ir: collections.abc.Sequence[IRInstruction],
+        *,
+        store_all: bool = False,
+        compact_heap: bool = False,
+    ) -> list[MacroOp]:
+        """
+        Parameters
+        ----------
+        ir : Sequence[IRInstruction]
+        store_all : bool, optional
+            Whether every value is stored to the heap, at its location.
+        compact_heap : bool, optional
+            Whether the heap slots of dead values are reused. It is ignored
+            if `store_all` is set.
+
+        Returns
+        -------
+        list[MacroOp]
+        """
+
+        self.store_all = store_all
+        self.compact_heap = compact_heap and not store_all
+        self.reset(instruction.get_operands() for instruction in ir)
+
+        for self.index, instruction in enumerate(ir):
+            self.lower(instruction)
+
+        self.check_freed_registers()
+        self.check_heap_size()
+
+        return self.ops
+
+    def generate_packed(
+        self,
+        ir: PackedIR,
+        *,
+        store_all: bool = False,
+        compact_heap: bool = False,
+    ) -> list[MacroOp]:
+        """
+        Lower a packed SSA IR, reading its columns without unpacking it.
+
+        Parameters
+        ----------
+        ir : PackedIR
+        store_all : bool, optional
+            Whether every value is stored to the heap, at its location.
+        compact_heap : bool, optional
+            Whether the heap slots of dead values are reused. It is ignored
+            if `store_all` is set.
+
+        Returns
+        -------
+        list[MacroOp]
+        """
+
+        self.store_all = store_all
+        self.compact_heap = compact_heap and not store_all
+        self.reset(ir.get_operands(index) for index in range(len(ir)))
+
+        for self.index in range(len(ir)):
+            self.lower_packed(ir, self.index)
+
+        self.check_freed_registers()
+        self.check_heap_size()
+
         return self.ops
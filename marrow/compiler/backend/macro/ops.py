@@ -16,12 +16,17 @@ if typing.TYPE_CHECKING:
 
 class MacroOpVisitor[R_co](typing.Protocol):
     def visit_load(self, op: Load) -> R_co: ...
+    def visit_load_immediate(self, op: LoadImmediate) -> R_co: ...
     def visit_store(self, op: Store) -> R_co: ...
     def visit_store_immediate(self, op: StoreImmediate) -> R_co: ...
     def visit_push(self, op: Push) -> R_co: ...
     def visit_pop(self, op: Pop) -> R_co: ...
 
     def visit_binary_arithmetic(self, op: BinaryArithmetic) -> R_co: ...
+    def visit_binary_arithmetic_immediate(
+        self,
+        op: BinaryArithmeticImmediate,
+    ) -> R_co: ...
     def visit_unary_arithmetic(self, op: UnaryArithmetic) -> R_co: ...
 
     def visit_dump_memory(self, op: DumpHeap) -> R_co: ...
@@ -42,6 +47,16 @@ class Load(MacroOpBase):
         return visitor.visit_load(self)
 
 
+@attrs.frozen
+class LoadImmediate(MacroOpBase):
+    destination: RegisterNumber
+    type: ImmediateType
+    immediate: bytearray
+
+    def accept[R](self, visitor: MacroOpVisitor[R]) -> R:
+        return visitor.visit_load_immediate(self)
+
+
 @attrs.frozen
 class Store(MacroOpBase):
     destination: MemoryAddress
@@ -91,6 +106,18 @@ class BinaryArithmetic(MacroOpBase):
         return visitor.visit_binary_arithmetic(self)
 
 
+@attrs.frozen
+class BinaryArithmeticImmediate(MacroOpBase):
+    func: BinaryArithmeticFunc
+    type: ImmediateType
+    destination: RegisterNumber
+    left: RegisterNumber
+    immediate: bytearray
+
+    def accept[R](self, visitor: MacroOpVisitor[R]) -> R:
+        return visitor.visit_binary_arithmetic_immediate(self)
+
+
 @attrs.frozen
 class UnaryArithmetic(MacroOpBase):
     func: UnaryArithmeticFunc
@@ -111,7 +138,8 @@ class DumpHeap(MacroOpBase):
         return visitor.visit_dump_memory(self)
 
 
-type LoadStoreMacroOp = Load | Store | StoreImmediate
+type LoadStoreMacroOp = Load | LoadImmediate | Store | StoreImmediate
 type StackMacroOp = Push | Pop
+type ArithmeticMacroOp = BinaryArithmetic | BinaryArithmeticImmediate | UnaryArithmetic
 type DebugMacroOp = DumpHeap
-type MacroOp = LoadStoreMacroOp | BinaryArithmetic | UnaryArithmetic | DebugMacroOp
+type MacroOp = LoadStoreMacroOp | ArithmeticMacroOp | DebugMacroOp
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import typing
+
+import attrs
+
+from .ops import BinaryArithmetic
+from .ops import BinaryArithmeticImmediate
+from .ops import DumpHeap
+from .ops import Load
+from .ops import LoadImmediate
+from .ops import Pop
+from .ops import Push
+from .ops import Store
+from .ops import StoreImmediate
+from .ops import UnaryArithmetic
+
+if typing.TYPE_CHECKING:
+    from marrow.types import ImmediateType
+    from marrow.types import MemoryAddress
+    from marrow.types import RegisterNumber
+
+    from .ops import MacroOp
+
+
+@attrs.define
+class PeepholeStats:
+    """
+    Statistics of a peephole optimization.
+
+    Attributes
+    ----------
+    redundant_loads : int
+        The number of loads into a register already holding the value.
+    redundant_stores : int
+        The number of stores of a value already in the heap slot.
+    dead_stores : int
+        The number of stores overwritten before being read.
+    dead_loads : int
+        The number of loads into a register overwritten before being read.
+    forwarded_immediates : int
+        The number of loads of a heap slot holding a known immediate that
+        were replaced by immediate loads.
+    """
+
+    redundant_loads: int = 0
+    redundant_stores: int = 0
+    dead_stores: int = 0
+    dead_loads: int = 0
+    forwarded_immediates: int = 0
+
+    @property
+    def removed_count(self) -> int:
+        return (
+            self.redundant_loads
+            + self.redundant_stores
+            + self.dead_stores
+            + self.dead_loads
+        )
+
+
+class PeepholeOptimizer:
+    """
+    Removes the macro ops that do not change the state of the machine.
+
+    A forward pass tracks the heap slot whose value each register holds, to
+    remove the loads and stores copying a value where it already is, and
+    the immediates stored in the heap, to load them without reading it. A
+    backward pass removes the stores and loads whose destination is
+    overwritten before being read.
+
+    The heap and the registers end up in the same state, and the memory dumps
+    show the same values.
+    """
+
+    def __init__(self) -> None:
+        self.stats = PeepholeStats()
+
+    def remove_redundant(self, ops: list[MacroOp]) -> list[MacroOp]:
+        # the heap slot whose value is held by each register
+        contents: dict[RegisterNumber, MemoryAddress] = {}
+        # the immediate held by each heap slot, if known
+        immediates: dict[MemoryAddress, tuple[ImmediateType, bytearray]] = {}
+        optimized_ops: list[MacroOp] = []
+
+        def forget(location: MemoryAddress) -> None:
+            immediates.pop(location, None)
+
+            for register, slot in list(contents.items()):
+                if slot == location:
+                    del contents[register]
+
+        for op in ops:
+            match op:
+                case Load(destination, source):
+                    if contents.get(destination) == source:
+                        self.stats.redundant_loads += 1
+                        continue
+
+                    contents[destination] = source
+
+                    if source in immediates:
+                        self.stats.forwarded_immediates += 1
+                        op = LoadImmediate(destination, *immediates[source])
+                case Store(destination, source):
+                    if contents.get(source) == destination:
+                        self.stats.redundant_stores += 1
+                        continue
+
+                    forget(destination)
+                    contents[source] = destination
+                case StoreImmediate(destination, type, immediate):
+                    forget(destination)
+                    immediates[destination] = (type, immediate)
+                case (
+                    LoadImmediate(destination, _, _)
+                    | BinaryArithmetic(_, _, destination, _, _)
+                    | BinaryArithmeticImmediate(_, _, destination, _, _)
+                    | UnaryArithmetic(_, _, destination, _)
+                    | Pop(_, destination)
+                ):
+                    contents.pop(destination, None)
+                case Push() | DumpHeap():
+                    pass
+
+            optimized_ops.append(op)
+
+        return optimized_ops
+
+    def remove_dead(self, ops: list[MacroOp]) -> list[MacroOp]:
+        # the heap slots and registers written later before being read
+        overwritten: set[MemoryAddress] = set()
+        dead_registers: set[RegisterNumber] = set()
+        optimized_ops: list[MacroOp] = []
+
+        for op in reversed(ops):
+            match op:
+                case Load(destination, source):
+                    if destination in dead_registers:
+                        self.stats.dead_loads += 1
+                        continue
+
+                    dead_registers.add(destination)
+                    overwritten.discard(source)
+                case Store(destination, source):
+                    if destination in overwritten:
+                        self.stats.dead_stores += 1
+                        continue
+
+                    overwritten.add(destination)
+                    dead_registers.discard(source)
+                case StoreImmediate(destination, _, _):
+                    if destination in overwritten:
+                        self.stats.dead_stores += 1
+                        continue
+
+                    overwritten.add(destination)
+                case LoadImmediate(destination, _, _):
+                    if destination in dead_registers:
+                        self.stats.dead_loads += 1
+                        continue
+
+                    dead_registers.add(destination)
+                case BinaryArithmetic(_, _, destination, left, right):
+                    # kept even if dead, as the runtime reports overflows
+                    dead_registers.add(destination)
+                    dead_registers.difference_update((left, right))
+                case BinaryArithmeticImmediate(_, _, destination, left, _):
+                    dead_registers.add(destination)
+                    dead_registers.discard(left)
+                case UnaryArithmetic(_, _, destination, source):
+                    dead_registers.add(destination)
+                    dead_registers.discard(source)
+                case Pop(_, destination):
+                    dead_registers.add(destination)
+                case DumpHeap():
+                    overwritten.clear()
+                case Push():
+                    pass
+
+            optimized_ops.append(op)
+
+        optimized_ops.reverse()
+
+        return optimized_ops
+
+    def optimize(self, ops: list[MacroOp]) -> list[MacroOp]:
+        """
+        Parameters
+        ----------
+        ops : list[MacroOp]
+            The macro ops to optimize.
+
+        Returns
+        -------
+        list[MacroOp]
+            The macro ops without the redundant and dead ones.
+        """
+
+        self.stats = PeepholeStats()
+
+        return self.remove_dead(self.remove_redundant(ops))
@@ -6,10 +6,12 @@ import typing
 
 from marrow.compiler.backend.macro.ops import DumpHeap
 from marrow.compiler.components import Parser
-from marrow.compiler.components import Tokenizer
+from marrow.compiler.middleend.SSAIR.packed import PackedIR
 from marrow.compiler.renderers.util import render_memory_location
 from marrow.tooling import CompilerTooling
 
+from .options import CompilerOptions
+from .passes import PassManager
 from .resources import CompilerResources
 
 if typing.TYPE_CHECKING:
@@ -19,25 +21,72 @@ if typing.TYPE_CHECKING:
 
 
 class Compiler:
-    def __init__(self, tooling: GlobalTooling, verbose: bool, debug: bool) -> None:
+    def __init__(
+        self,
+        tooling: GlobalTooling,
+        verbose: bool,
+        debug: bool,
+        options: CompilerOptions | None = None,
+    ) -> None:
         self.tooling: typing.Final = CompilerTooling.from_global(tooling)
+        self.options: typing.Final = options or CompilerOptions()
 
         self.resources = CompilerResources(io.StringIO())
 
         self.verbose: typing.Final = verbose
         self.debug: typing.Final = debug
 
+        self.ir_passes: typing.Final[PassManager[IRInstruction]] = PassManager(
+            "SSA IR",
+        )
+        self.macro_op_passes: typing.Final[PassManager[MacroOp]] = PassManager(
+            "macro op",
+        )
+        self.register_passes()
+
         self.log_preparative_setup(
-            "parse tree sanity checker",
             *(("parse tree renderer",) if self.debug else ()),
             "SSA IR generator",
+            "constant folder",
+            "common subexpression eliminator",
+            "dead code eliminator",
             *(("SSA rvalue renderer",) if self.debug else ()),
             "macro op generator",
+            "peephole optimizer",
             *(("macro op renderer",) if self.debug else ()),
         )
 
         self.tooling.logger.success("compiler initialized")
 
+    def register_passes(self) -> None:
+        self.ir_passes.register("constant folding", self.fold_constants, level=1)
+        self.ir_passes.register(
+            "dead code elimination",
+            self.eliminate_dead_code,
+            level=1,
+        )
+        self.ir_passes.register(
+            "common subexpression elimination",
+            self.eliminate_common_subexpressions,
+            level=2,
+            before="dead code elimination",
+        )
+
+        self.ir_passes.set_enabled("constant folding", self.options.fold_constants)
+        # the heap dump of debug mode shows the values of every statement, which
+        # merging or removing statements would hide
+        self.ir_passes.set_enabled(
+            "common subexpression elimination",
+            self.options.eliminate_common_subexpressions and not self.debug,
+        )
+        self.ir_passes.set_enabled(
+            "dead code elimination",
+            self.options.eliminate_dead_code and not self.debug,
+        )
+
+        self.macro_op_passes.register("peephole", self.optimize_peephole, level=1)
+        self.macro_op_passes.set_enabled("peephole", self.options.peephole)
+
     def initialize_resources(self, file: typing.TextIO) -> None:
         self.resources = CompilerResources(file)
 
@@ -85,6 +134,68 @@ class Compiler:
 
         return buffer.getvalue()
 
+    def make_constant_folding_log(
+        self,
+        ir: list[IRInstruction],
+        folded_ir: list[IRInstruction],
+    ) -> str:
+        buffer = io.StringIO()
+
+        print(
+            f"folded constants: {len(ir)} -> {len(folded_ir)} SSA IR instructions",
+            file=buffer,
+        )
+
+        if self.debug:
+            print(self.make_ssa_instructions_log(folded_ir), file=buffer)
+
+        return buffer.getvalue()
+
+    def make_cse_log(self, ir: list[IRInstruction]) -> str:
+        buffer = io.StringIO()
+        stats = self.tooling.cse.stats
+
+        print(
+            f"eliminated {stats.eliminated_count} of {stats.instruction_count} SSA IR instructions",
+            file=buffer,
+        )
+        print(f"• {stats.eliminated_atoms} duplicate literal(s)", file=buffer)
+        print(f"• {stats.eliminated_operations} common subexpression(s)", file=buffer)
+
+        if self.debug:
+            print(self.make_ssa_instructions_log(ir), file=buffer)
+
+        return buffer.getvalue()
+
+    def make_dce_log(self, ir: list[IRInstruction]) -> str:
+        buffer = io.StringIO()
+
+        print(
+            f"eliminated {self.tooling.dce.eliminated_count} dead SSA IR instruction(s)",
+            file=buffer,
+        )
+
+        if self.debug:
+            print(self.make_ssa_instructions_log(ir), file=buffer)
+
+        return buffer.getvalue()
+
+    def make_peephole_log(self, macro_ops: list[MacroOp]) -> str:
+        buffer = io.StringIO()
+        stats = self.tooling.peephole_optimizer.stats
+
+        print(f"removed {stats.removed_count} macro op(s)", file=buffer)
+        print(f"• {stats.redundant_loads} redundant load(s)", file=buffer)
+        print(f"• {stats.redundant_stores} redundant store(s)", file=buffer)
+        print(f"• {stats.dead_loads} dead load(s)", file=buffer)
+        print(f"• {stats.dead_stores} dead store(s)", file=buffer)
+        print(f"• {stats.forwarded_immediates} forwarded immediate(s)", file=buffer)
+
+        if self.debug:
+            print(self.make_macro_ops_log(macro_ops), file=buffer)
+
+        return buffer.getvalue()
+
     def make_macro_ops_log(self, macro_ops: list[MacroOp]) -> str:
         buffer = io.StringIO()
 
@@ -104,16 +215,29 @@ class Compiler:
         return buffer.getvalue()
 
     def tokenize(self) -> None:
-        tokens = Tokenizer(self.resources.file).run()
+        tokenizer = self.options.tokenizer(self.resources.file)
+
+        if self.options.compact_tokens:
+            tokens = iter(tokenizer.run_compact())
+        else:
+            tokens = tokenizer.run()
+
         self.tooling.logger.info("tokenized source")
 
         self.resources.tokens = tokens
 
     def parse(self) -> None:
-        parse_tree = Parser(self.resources.tokens, self.tooling).run()
+        parser = Parser(
+            self.resources.tokens,
+            self.tooling,
+            iterative=self.options.iterative_parser,
+            max_errors=self.options.max_errors,
+        )
+        parse_tree = parser.run()
         self.tooling.logger.info("parsed source")
 
         self.resources.parse_tree = parse_tree
+        self.resources.invalid_nodes = parser.invalid_nodes
 
         if self.debug:
             self.tooling.logger.debug(self.make_parse_tree_log())
@@ -124,11 +248,81 @@ class Compiler:
 
         self.resources.ir = ir
 
+    def fold_constants(self, ir: list[IRInstruction]) -> list[IRInstruction]:
+        optimized_ir = self.tooling.constant_folder.fold(ir)
+        self.tooling.logger.info(self.make_constant_folding_log(ir, optimized_ir))
+
+        return optimized_ir
+
+    def eliminate_common_subexpressions(
+        self,
+        ir: list[IRInstruction],
+    ) -> list[IRInstruction]:
+        optimized_ir = self.tooling.cse.eliminate(ir)
+        self.tooling.logger.info(self.make_cse_log(optimized_ir))
+
+        return optimized_ir
+
+    def eliminate_dead_code(self, ir: list[IRInstruction]) -> list[IRInstruction]:
+        optimized_ir = self.tooling.dce.eliminate(ir)
+        self.tooling.logger.info(self.make_dce_log(optimized_ir))
+
+        return optimized_ir
+
+    def optimize_ssa_ir(self) -> None:
+        self.resources.ir = self.ir_passes.run(
+            self.resources.ir,
+            self.options.optimization_level,
+            profile=self.debug,
+        )
+
+        if self.debug:
+            self.tooling.logger.debug(self.ir_passes.make_report_log())
+
     def generate_macro_ops(self) -> None:
-        macro_ops = self.tooling.macro_op_generator.generate(self.resources.ir)
+        # the heap dump of debug mode shows the values of every statement, so
+        # the ones kept in registers are stored too, each at its location
+        if self.options.packed_ir:
+            packed_ir = PackedIR.from_instructions(self.resources.ir)
+            self.tooling.logger.info(
+                f"packed SSA IR: {len(packed_ir)} instructions, "
+                f"{len(packed_ir.constants)} constant(s)",
+            )
+
+            # the packed copy replaces the list, which can then be collected
+            self.resources.ir = []
+            macro_ops = self.tooling.macro_op_generator.generate_packed(
+                packed_ir,
+                store_all=self.debug,
+                compact_heap=self.options.compact_heap,
+            )
+        else:
+            macro_ops = self.tooling.macro_op_generator.generate(
+                self.resources.ir,
+                store_all=self.debug,
+                compact_heap=self.options.compact_heap,
+            )
+
         self.tooling.logger.info(self.make_macro_ops_generation_log(macro_ops))
 
+        self.resources.macro_ops = macro_ops
+
+    def optimize_peephole(self, macro_ops: list[MacroOp]) -> list[MacroOp]:
+        optimized_macro_ops = self.tooling.peephole_optimizer.optimize(macro_ops)
+        self.tooling.logger.info(self.make_peephole_log(optimized_macro_ops))
+
+        return optimized_macro_ops
+
+    def optimize_macro_ops(self) -> None:
+        macro_ops = self.macro_op_passes.run(
+            self.resources.macro_ops,
+            self.options.optimization_level,
+            profile=self.debug,
+        )
+
         if self.debug:
+            self.tooling.logger.debug(self.macro_op_passes.make_report_log())
+
             macro_ops.append(DumpHeap(0))
             self.tooling.logger.info("injected memory dump op")
 
@@ -148,26 +342,29 @@ class Compiler:
         self.resources.file.close()
         self.tooling.logger.note("done with the file - closed")
 
-        is_parse_tree_sane = self.tooling.sanity_checker.is_sane(
-            self.resources.parse_tree,
-        )
-        self.tooling.logger.info("checked parse tree sanity")
-
-        if not is_parse_tree_sane:
+        if self.resources.invalid_nodes:
             self.tooling.logger.info("found invalid nodes!")
 
-            for node in self.tooling.sanity_checker.invalid_nodes:
+            for node in self.resources.invalid_nodes:
                 self.tooling.logger.error(
                     node.message,
                     source_path=node.token.file.name,
                 )
 
+            if (
+                self.options.max_errors is not None
+                and len(self.resources.invalid_nodes) >= self.options.max_errors
+            ):
+                self.tooling.logger.error("too many errors - stopped parsing")
+
             return 1
 
         self.tooling.logger.success("parse tree seems sane")
 
         self.generate_ssa_ir()
+        self.optimize_ssa_ir()
         self.generate_macro_ops()
+        self.optimize_macro_ops()
 
         time_end = time.perf_counter()
 
@@ -36,6 +36,8 @@ class ExprBase(abc.ABC):
     Base class from which every AST node inherits from.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def accept[R](self, visitor: ExprVisitor[R]) -> R:
         """
@@ -47,7 +49,7 @@ class ExprBase(abc.ABC):
         """
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class BinaryExpr(ExprBase):
     """
     Node representing a binary expression.
@@ -70,7 +72,7 @@ class BinaryExpr(ExprBase):
         return visitor.visit_binary_expr(self)
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class BlockExpr(ExprBase):
     """
     Node representing a block expression.
@@ -87,7 +89,7 @@ class BlockExpr(ExprBase):
         return visitor.visit_block_expr(self)
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class GroupingExpr(ExprBase):
     """
     Node representing an expression surrounded by parentheses.
@@ -104,7 +106,7 @@ class GroupingExpr(ExprBase):
         return visitor.visit_grouping_expr(self)
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class InvalidExpr(ExprBase):
     """
     Node representing an generic, invalid expression.
@@ -121,13 +123,13 @@ class InvalidExpr(ExprBase):
 
     message: str
     token: Token
-    subexprs: list[Expr] = []
+    subexprs: list[Expr] = attrs.field(factory=list)
 
     def accept[R](self, visitor: ExprVisitor[R]) -> R:
         return visitor.visit_invalid_expr(self)
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class LiteralScalarExpr(ExprBase):
     """
     Node representing a scalar literal.
@@ -147,7 +149,7 @@ class LiteralScalarExpr(ExprBase):
         return visitor.visit_literal_scalar_expr(self)
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class ModExpr(ExprBase):
     """
     Node representing a module expression.
@@ -164,7 +166,7 @@ class ModExpr(ExprBase):
         return visitor.visit_mod_expr(self)
 
 
-@attrs.frozen(slots=False)
+@attrs.frozen
 class UnaryExpr(ExprBase):
     """
     Node representing a unary expression.
@@ -0,0 +1,109 @@
+"""
+Non-recursive traversals of the AST.
+
+They walk the tree with an explicit stack, so the depth of the tree is not
+bounded by the recursion limit.
+
+The children of a node are found by testing its type inline rather than
+through a visitor or `isinstance`: a walk visits every node of the tree, and
+both the two method calls of `accept` and the instance checks of the
+abstract base class would make it several times slower than a recursive
+visitor.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+
+from . import expr
+
+
+def iter_preorder(
+    root: expr.Expr,
+    skip: type[expr.Expr] | None = None,
+) -> collections.abc.Iterator[expr.Expr]:
+    """
+    Iterate over the nodes of the tree, parents before their children.
+
+    Parameters
+    ----------
+    root : Expr
+        The root of the tree.
+    skip : type[Expr], optional
+        If given, the nodes of this type are yielded but their children are
+        not.
+
+    Yields
+    ------
+    Expr
+        The nodes of the tree.
+    """
+
+    stack = [root]
+
+    while stack:
+        expression = stack.pop()
+
+        yield expression
+
+        # the children are pushed right to left, to be popped left to right
+        if type(expression) is expr.LiteralScalarExpr or type(expression) is skip:
+            continue
+        elif type(expression) is expr.BinaryExpr:
+            stack.append(expression.right)
+            stack.append(expression.left)
+        elif type(expression) is expr.BlockExpr:
+            stack.extend(reversed(expression.expr_list))
+        elif type(expression) is expr.GroupingExpr:
+            stack.append(expression.grouped)
+        elif type(expression) is expr.InvalidExpr:
+            stack.extend(reversed(expression.subexprs))
+        elif type(expression) is expr.ModExpr:
+            stack.append(expression.expr)
+        elif type(expression) is expr.UnaryExpr:
+            stack.append(expression.operand)
+
+
+def iter_postorder(root: expr.Expr) -> collections.abc.Iterator[expr.Expr]:
+    """
+    Iterate over the nodes of the tree, children before their parents.
+
+    The nodes are first collected parent first and right to left, then
+    yielded in reverse, which avoids tracking the state of each node.
+
+    Parameters
+    ----------
+    root : Expr
+        The root of the tree.
+
+    Returns
+    -------
+    Iterator[Expr]
+        The nodes of the tree.
+    """
+
+    stack = [root]
+    nodes: list[expr.Expr] = []
+
+    while stack:
+        expression = stack.pop()
+
+        nodes.append(expression)
+
+        if type(expression) is expr.LiteralScalarExpr:
+            continue
+        elif type(expression) is expr.BinaryExpr:
+            stack.append(expression.left)
+            stack.append(expression.right)
+        elif type(expression) is expr.BlockExpr:
+            stack.extend(expression.expr_list)
+        elif type(expression) is expr.GroupingExpr:
+            stack.append(expression.grouped)
+        elif type(expression) is expr.InvalidExpr:
+            stack.extend(expression.subexprs)
+        elif type(expression) is expr.ModExpr:
+            stack.append(expression.expr)
+        elif type(expression) is expr.UnaryExpr:
+            stack.append(expression.operand)
+
+    return reversed(nodes)
@@ -17,6 +17,18 @@ if typing.TYPE_CHECKING:
     from marrow.compiler.common import Token
     from marrow.tooling import GlobalTooling
 
+type ParseSteps = collections.abc.Generator[int, expr.Expr, expr.Expr]
+"""
+Resumable parsing of an expression.
+
+The generator yields the precedence of each sub-expression it needs, is sent
+back the parsed sub-expression, and returns the resulting expression.
+"""
+
+
+class _ErrorLimitReached(Exception):
+    """Raised to stop parsing once the maximum number of errors is reached."""
+
 
 class ParserBase:
     """
@@ -24,17 +36,31 @@ class ParserBase:
 
     Children can override `initialize_subparsers` if they wish to add
     subparsers to be used.
+
+    If `iterative` is set, expressions are parsed with an explicit stack of
+    suspended subparsers instead of recursive calls, so the nesting depth of
+    the source is not bounded by the recursion limit.
+
+    Invalid nodes are recorded in `invalid_nodes` as they are created. If
+    `max_errors` is set, parsing stops once that many have been recorded.
     """
 
     def __init__(
         self,
         tokens: collections.abc.Iterator[Token],
         tooling: GlobalTooling,
+        *,
+        iterative: bool = False,
+        max_errors: int | None = None,
     ) -> None:
         self.tooling = tooling
+        self.iterative: typing.Final = iterative
+        self.max_errors: typing.Final = max_errors
+
+        self.invalid_nodes: list[expr.InvalidExpr] = []
 
         self.tokens: typing.Final = tokens
-        self.buffer: list[Token] = []
+        self.buffer: collections.deque[Token] = collections.deque()
 
         self.atom_parsers: dict[TokenType, subparsers.AtomSubparser] = {}
         self.prefix_parsers: dict[TokenType, subparsers.PrefixSubparser] = {}
@@ -161,7 +187,7 @@ class ParserBase:
 
             return Ok(self.consume())
 
-        return self.buffer.pop(0)
+        return self.buffer.popleft()
 
     def match(self, expected: TokenType) -> bool:
         """
@@ -186,6 +212,38 @@ class ParserBase:
 
         return True
 
+    def record_invalid(
+        self,
+        node: expr.InvalidExpr,
+        mark: int | None = None,
+    ) -> expr.InvalidExpr:
+        """
+        Record an invalid node created while parsing.
+
+        Parameters
+        ----------
+        node : InvalidExpr
+        mark : int, optional
+            The length of `invalid_nodes` before the sub-nodes of `node` were
+            parsed. The invalid nodes recorded since are nested in `node`, so
+            they are not reported on their own.
+
+        Returns
+        -------
+        InvalidExpr
+            The recorded node.
+        """
+
+        if mark is not None:
+            del self.invalid_nodes[mark:]
+
+        self.invalid_nodes.append(node)
+
+        if self.max_errors is not None and len(self.invalid_nodes) >= self.max_errors:
+            raise _ErrorLimitReached
+
+        return node
+
     def parse_expr(self, precedence: int = 0) -> expr.Expr:
         """
         Parse an expression by consuming tokens.
@@ -196,6 +254,9 @@ class ParserBase:
             The precedence of the operator of the expression being parsed.
         """
 
+        if self.iterative:
+            return self.parse_expr_iteratively(precedence)
+
         token = self.consume()
         subparser = self.prefix_parsers.get(
             token.type,
@@ -203,7 +264,9 @@ class ParserBase:
         )
 
         if subparser is None:
-            return expr.InvalidExpr(f"unexpected token {token.lexeme!r}", token)
+            return self.record_invalid(
+                expr.InvalidExpr(f"unexpected token {token.lexeme!r}", token),
+            )
 
         left = subparser.parse(self, token)
 
@@ -218,6 +281,86 @@ class ParserBase:
 
         return left
 
+    def parse_expr_iteratively(self, precedence: int = 0) -> expr.Expr:
+        """
+        Parse an expression by consuming tokens, without recursion.
+
+        Each subparser waiting for a sub-expression is suspended on a stack,
+        along with the precedence of the expression it belongs to.
+
+        Parameters
+        ----------
+        precedence : int, optional
+            The precedence of the operator of the expression being parsed.
+        """
+
+        frames: list[tuple[ParseSteps, int]] = []
+
+        while True:
+            token = self.consume()
+            subparser = self.prefix_parsers.get(
+                token.type,
+                self.atom_parsers.get(token.type),
+            )
+
+            result: expr.Expr | None = None
+
+            if subparser is None:
+                result = self.record_invalid(
+                    expr.InvalidExpr(f"unexpected token {token.lexeme!r}", token),
+                )
+            else:
+                frames.append((subparser.parse_steps(self, token), precedence))
+
+            # resume the suspended subparsers until one needs a sub-expression
+            while frames:
+                steps, frame_precedence = frames[-1]
+
+                try:
+                    precedence = next(steps) if result is None else steps.send(result)
+                except StopIteration as stop:
+                    frames.pop()
+                    result = stop.value
+                else:
+                    break
+
+                if result is None:
+                    raise RuntimeError("critical error: a subparser returned nothing")
+
+                if frame_precedence < self.get_precedence():
+                    token = self.consume()
+                    subparser = self.nonprefix_parsers[token.type]
+
+                    frames.append(
+                        (subparser.parse_steps(self, result, token), frame_precedence),
+                    )
+                    result = None
+            else:
+                return typing.cast(expr.Expr, result)
+
+    def drive(self, steps: ParseSteps) -> expr.Expr:
+        """
+        Run resumable parsing to completion, parsing the requested
+        sub-expressions with `parse_expr`.
+
+        Parameters
+        ----------
+        steps : ParseSteps
+
+        Returns
+        -------
+        Expr
+            The resulting parsed expression.
+        """
+
+        try:
+            precedence = next(steps)
+
+            while True:
+                precedence = steps.send(self.parse_expr(precedence))
+        except StopIteration as stop:
+            return stop.value
+
     def run(self) -> expr.Expr:
         """
         Run the parser.
@@ -225,9 +368,19 @@ class ParserBase:
         Returns
         -------
         Expr
-            The resulting parsed expression.
+            The resulting parsed expression. If the maximum number of errors
+            was reached, it is an invalid node wrapping the recorded ones.
         """
-        expression = self.parse_expr()
+        self.invalid_nodes.clear()
+
+        try:
+            expression = self.parse_expr()
+        except _ErrorLimitReached:
+            return expr.InvalidExpr(
+                f"too many errors ({len(self.invalid_nodes)}), stopped parsing",
+                self.peek(),
+                list(self.invalid_nodes),
+            )
 
         if self.buffer and self.buffer[0].type is not TokenType.EOF:
             self.tooling.logger.warn(
@@ -13,6 +13,9 @@ from marrow.compiler.frontend.ast import expr
 if typing.TYPE_CHECKING:
     from marrow.compiler.common import Token
     from marrow.compiler.frontend.parser.base import ParserBase
+    from marrow.compiler.frontend.parser.base import ParseSteps
+
+BLOCK_TERMINATORS: typing.Final = frozenset({TokenType.END, TokenType.EOF})
 
 
 class AtomSubparser(abc.ABC):
@@ -34,15 +37,32 @@ class AtomSubparser(abc.ABC):
             The parsed expression.
         """
 
+    def parse_steps(self, parser: ParserBase, token: Token) -> ParseSteps:
+        """
+        Resumable version of `parse`, used by the iterative parser.
+
+        Subparsers that need sub-expressions should override it, yielding
+        their precedence instead of calling `parser.parse_expr`. By default,
+        it does not yield and parses the sub-expressions recursively.
+        """
+
+        yield from ()
+
+        return self.parse(parser, token)
+
 
 class BlockSubparser(AtomSubparser):
     """Parser for block expressions."""
 
     def parse(self, parser: ParserBase, token: Token) -> expr.Expr:
+        return parser.drive(self.parse_steps(parser, token))
+
+    def parse_steps(self, parser: ParserBase, token: Token) -> ParseSteps:
+        mark = len(parser.invalid_nodes)
         expr_list: list[expr.Expr] = []
 
-        while parser.peek().type not in {TokenType.END, TokenType.EOF}:
-            expr_list.append(parser.parse_expr())
+        while parser.peek().type not in BLOCK_TERMINATORS:
+            expr_list.append((yield 0))
 
             if (parser.peek()).type is not TokenType.END and isinstance(
                 parser.consume(TokenType.SEMICOLON),
@@ -50,15 +70,20 @@ class BlockSubparser(AtomSubparser):
             ):
                 current_token = parser.peek()
                 expr_list.append(
-                    expr.InvalidExpr(
-                        f"expected ';' after {current_token.type.name}",
-                        current_token,
-                        [],
+                    parser.record_invalid(
+                        expr.InvalidExpr(
+                            f"expected ';' after {current_token.type.name}",
+                            current_token,
+                            [],
+                        ),
                     ),
                 )
 
         if isinstance(parser.consume(TokenType.END), Err):
-            return expr.InvalidExpr("missing expected 'end'", token, expr_list)
+            return parser.record_invalid(
+                expr.InvalidExpr("missing expected 'end'", token, expr_list),
+                mark,
+            )
 
         return expr.BlockExpr(expr_list)
 
@@ -67,10 +92,17 @@ class GroupingSubparser(AtomSubparser):
     """Parser for grouping expressions."""
 
     def parse(self, parser: ParserBase, token: Token) -> expr.Expr:
-        expression = parser.parse_expr()
+        return parser.drive(self.parse_steps(parser, token))
+
+    def parse_steps(self, parser: ParserBase, token: Token) -> ParseSteps:
+        mark = len(parser.invalid_nodes)
+        expression = yield 0
 
         if isinstance(parser.consume(TokenType.RIGHT_PAREN), Err):
-            return expr.InvalidExpr("missing expected ')'", token, [expression])
+            return parser.record_invalid(
+                expr.InvalidExpr("missing expected ')'", token, [expression]),
+                mark,
+            )
 
         return expr.GroupingExpr(expression)
 
@@ -135,4 +167,7 @@ class ModSubparser(AtomSubparser):
     """Parser for module expressions."""
 
     def parse(self, parser: ParserBase, token: Token) -> expr.Expr:
-        return expr.ModExpr(parser.parse_expr())
+        return parser.drive(self.parse_steps(parser, token))
+
+    def parse_steps(self, parser: ParserBase, token: Token) -> ParseSteps:
+        return expr.ModExpr((yield 0))
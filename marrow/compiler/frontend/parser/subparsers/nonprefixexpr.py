@@ -11,6 +11,7 @@ if typing.TYPE_CHECKING:
     from marrow.compiler.common import BinaryOpTokenType
     from marrow.compiler.common import Token
     from marrow.compiler.frontend.parser.base import ParserBase
+    from marrow.compiler.frontend.parser.base import ParseSteps
 
 
 class NonprefixSubparser(abc.ABC):
@@ -45,6 +46,21 @@ class NonprefixSubparser(abc.ABC):
             The parsed expression.
         """
 
+    def parse_steps(
+        self,
+        parser: ParserBase,
+        left: expr.Expr,
+        token: Token,
+    ) -> ParseSteps:
+        """
+        Resumable version of `parse`, used by the iterative parser.
+        See `AtomSubparser.parse_steps`.
+        """
+
+        yield from ()
+
+        return self.parse(parser, left, token)
+
 
 @attrs.frozen
 class BinaryNonprefixSubparser(NonprefixSubparser):
@@ -57,7 +73,15 @@ class BinaryNonprefixSubparser(NonprefixSubparser):
         return self.precedence
 
     def parse(self, parser: ParserBase, left: expr.Expr, token: Token) -> expr.Expr:
-        right = parser.parse_expr(self.precedence - self.is_right_associative)
+        return parser.drive(self.parse_steps(parser, left, token))
+
+    def parse_steps(
+        self,
+        parser: ParserBase,
+        left: expr.Expr,
+        token: Token,
+    ) -> ParseSteps:
+        right = yield self.precedence - self.is_right_associative
 
         return expr.BinaryExpr(
             typing.cast("BinaryOpTokenType", token.type),
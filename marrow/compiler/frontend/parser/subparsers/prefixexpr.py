@@ -9,6 +9,7 @@ if typing.TYPE_CHECKING:
     from marrow.compiler.common import Token
     from marrow.compiler.common import UnaryOpTokenType
     from marrow.compiler.frontend.parser.base import ParserBase
+    from marrow.compiler.frontend.parser.base import ParseSteps
 
 
 class PrefixSubparser(abc.ABC):
@@ -18,9 +19,22 @@ class PrefixSubparser(abc.ABC):
     def parse(self, parser: ParserBase, token: Token) -> expr.Expr:
         pass
 
+    def parse_steps(self, parser: ParserBase, token: Token) -> ParseSteps:
+        """
+        Resumable version of `parse`, used by the iterative parser.
+        See `AtomSubparser.parse_steps`.
+        """
+
+        yield from ()
+
+        return self.parse(parser, token)
+
 
 class UnaryPrefixSubparser(PrefixSubparser):
     def parse(self, parser: ParserBase, token: Token) -> expr.Expr:
-        operand = parser.parse_expr()
+        return parser.drive(self.parse_steps(parser, token))
+
+    def parse_steps(self, parser: ParserBase, token: Token) -> ParseSteps:
+        operand = yield 0
 
         return expr.UnaryExpr(typing.cast("UnaryOpTokenType", token.type), operand)
@@ -1,4 +1,5 @@
 from .ast import expr
+from .ast import traversal
 
 
 class ParseTreeSanityChecker(expr.ExprVisitor[None]):
@@ -6,15 +7,13 @@ class ParseTreeSanityChecker(expr.ExprVisitor[None]):
         self.invalid_nodes: list[expr.InvalidExpr] = []
 
     def visit_binary_expr(self, expression: expr.BinaryExpr) -> None:
-        expression.left.accept(self)
-        expression.right.accept(self)
+        pass
 
     def visit_block_expr(self, expression: expr.BlockExpr) -> None:
-        for subexpr in expression.expr_list:
-            subexpr.accept(self)
+        pass
 
     def visit_grouping_expr(self, expression: expr.GroupingExpr) -> None:
-        expression.grouped.accept(self)
+        pass
 
     def visit_invalid_expr(self, expression: expr.InvalidExpr) -> None:
         self.invalid_nodes.append(expression)
@@ -23,10 +22,10 @@ class ParseTreeSanityChecker(expr.ExprVisitor[None]):
         pass
 
     def visit_mod_expr(self, expression: expr.ModExpr) -> None:
-        expression.expr.accept(self)
+        pass
 
     def visit_unary_expr(self, expression: expr.UnaryExpr) -> None:
-        expression.operand.accept(self)
+        pass
 
     def is_sane(self, parse_tree: expr.Expr) -> bool:
         """
@@ -42,6 +41,9 @@ class ParseTreeSanityChecker(expr.ExprVisitor[None]):
         """
         self.invalid_nodes.clear()
 
-        parse_tree.accept(self)
+        # the sub-nodes of an invalid node are not reported on their own
+        for node in traversal.iter_preorder(parse_tree, skip=expr.InvalidExpr):
+            if type(node) is expr.InvalidExpr:
+                self.invalid_nodes.append(node)
 
         return not self.invalid_nodes
@@ -1,3 +1,4 @@
+import bisect
 import io
 import typing
 
@@ -13,6 +14,87 @@ class Span(typing.NamedTuple):
     end: int
 
 
+class LineIndex:
+    """
+    Index of the offsets at which the lines of a file start, used to convert
+    offsets into line and column numbers.
+
+    The index is built lazily, and extended whenever the contents of the file
+    have grown since the last lookup.
+    """
+
+    def __init__(self, contents: io.StringIO) -> None:
+        self.contents: typing.Final = contents
+
+        # the length of the contents indexed so far
+        self.length = 0
+        # the lines of the contents, with their line endings; the last one is
+        # the line being written, possibly empty
+        self.lines: list[str] = [""]
+        self.line_starts: list[int] = [0]
+
+    def update(self) -> None:
+        """Index the lines that have been added to the contents, if any."""
+
+        # the contents are only ever written at the end, so the position of
+        # the stream is their length
+        if self.contents.tell() == self.length:
+            return
+
+        # only the new contents are read, which leaves the stream at its end
+        self.contents.seek(self.length)
+        tail = self.contents.read()
+        self.length += len(tail)
+
+        # the last line may have been continued, so it is split again
+        *complete_lines, last_line = (self.lines.pop() + tail).split("\n")
+
+        for line in complete_lines:
+            self.lines.append(line + "\n")
+            self.line_starts.append(self.line_starts[-1] + len(line) + 1)
+
+        self.lines.append(last_line)
+
+    def get_position(self, offset: int) -> tuple[int, int]:
+        """
+        Parameters
+        ----------
+        offset : int
+            The offset in the contents.
+
+        Returns
+        -------
+        tuple[int, int]
+            The line number and the column number corresponding to the offset,
+            both starting from 1.
+        """
+
+        self.update()
+
+        line = bisect.bisect_right(self.line_starts, offset)
+
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def get_lines(self, start: int, end: int) -> list[str]:
+        """
+        Parameters
+        ----------
+        start : int
+            The number of the first line, starting from 1.
+        end : int
+            The number of the last line (included).
+
+        Returns
+        -------
+        list[str]
+            The lines between `start` and `end`, with their line endings.
+        """
+
+        self.update()
+
+        return self.lines[start - 1 : end]
+
+
 class FileProxy(typing.NamedTuple):
     """
     Proxy of the file from which the source comes from.
@@ -24,6 +106,7 @@ class FileProxy(typing.NamedTuple):
 
     name: str
     contents: io.StringIO
+    lines: LineIndex
 
 
 class Token(typing.NamedTuple):
@@ -48,31 +131,12 @@ class Token(typing.NamedTuple):
     file: FileProxy
 
     def get_lines(self) -> list[str]:
-        contents = self.file.contents.getvalue()
         (_, start), (_, end) = self.get_line_span()
 
-        return [line for line in contents.splitlines(keepends=True)[start - 1 : end]]
+        return self.file.lines.get_lines(start, end)
 
     def get_line_span(self) -> tuple[tuple[int, int], tuple[int, int]]:
-        contents = self.file.contents.getvalue()
-
-        start_line_offset = self.span.start
-        end_line_offset = self.span.end
-
-        for index, char in enumerate(reversed(contents[: self.span.start])):
-            if char == "\n":
-                start_line_offset = self.span.start - index
-                break
-
-        for index, char in enumerate(reversed(contents[: self.span.end])):
-            if char == "\n":
-                end_line_offset = self.span.end - index
-                break
-
-        line_start = len(contents[:start_line_offset].splitlines())
-        line_end = len(contents[:end_line_offset].splitlines())
+        line_start, column_start = self.file.lines.get_position(self.span.start)
+        line_end, column_end = self.file.lines.get_position(self.span.end)
 
-        return (
-            (self.span.start - start_line_offset + 1, line_start + 1),
-            (self.span.end - end_line_offset + 1, line_end + 1),
-        )
+        return ((column_start, line_start), (column_end, line_end))
@@ -0,0 +1,67 @@
+import array
+import collections.abc
+import typing
+
+from .token import FileProxy
+from .token import Span
+from .token import Token
+from .token_type import TokenType
+
+TOKEN_TYPES: typing.Final = {token_type.value: token_type for token_type in TokenType}
+
+
+class TokenStream:
+    """
+    Compact storage of the tokens of a file.
+
+    Tokens are stored as a structure of arrays (type codes, start offsets and
+    lexeme indexes) sharing a single file proxy. Each distinct lexeme is only
+    stored once, in a pool, so that the stream does not hold a copy of the
+    source. `Token` objects are only built when accessed.
+
+    The last stored token is expected to be the end-of-file one.
+    """
+
+    def __init__(
+        self,
+        file: FileProxy,
+        lexemes: list[str],
+        types: array.array[int],
+        starts: array.array[int],
+        lexeme_indexes: array.array[int],
+    ) -> None:
+        self.file: typing.Final = file
+        self.lexemes: typing.Final = lexemes
+
+        self.types: typing.Final = types
+        self.starts: typing.Final = starts
+        self.lexeme_indexes: typing.Final = lexeme_indexes
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        start = self.starts[index]
+        lexeme = self.lexemes[self.lexeme_indexes[index]]
+
+        return Token(
+            TOKEN_TYPES[self.types[index]],
+            lexeme,
+            Span(start, start + len(lexeme)),
+            self.file,
+        )
+
+    def __iter__(self) -> collections.abc.Generator[Token, None, None]:
+        """
+        Yields
+        ------
+        Token
+            The stored tokens, then the end-of-file token indefinitely, as
+            `Tokenizer.run` does.
+        """
+
+        for index in range(len(self)):
+            yield self[index]
+
+        while True:
+            yield self[-1]
@@ -1,13 +1,45 @@
+import array
 import collections.abc
 import io
+import re
 import typing
 
 from .token import FileProxy
+from .token import LineIndex
 from .token import Span
 from .token import Token
+from .token_stream import TokenStream
 from .token_type import KEYWORD_LEXEMES
 from .token_type import TokenType
 
+# NOTE: `\d` and `[^\W_]` respectively match the same characters as
+# `str.isdecimal` and `str.isalnum` ; symbols are checked against
+# `str.isalpha` separately since it cannot be expressed as a character class
+TOKEN_PATTERN = re.compile(
+    r"""
+    [ \t\r\n]*
+    (?:
+          (?P<FLOAT>\d+\.\d*)
+        | (?P<INTEGER>\d+)
+        | (?P<SYMBOL>[^\W\d_][^\W_]*)
+        | (?P<LEFT_PAREN>\()
+        | (?P<RIGHT_PAREN>\))
+        | (?P<MINUS>-)
+        | (?P<PERCENT>%)
+        | (?P<PLUS>\+)
+        | (?P<SLASH>/)
+        | (?P<STAR>\*)
+        | (?P<SEMICOLON>;)
+        | (?P<EOF>\0)
+        | (?P<INVALID>[^ \t\r\n])
+    )
+    """,
+    re.VERBOSE,
+)
+GROUP_TOKEN_TYPES: dict[str, TokenType] = {
+    name: TokenType[name] for name in TOKEN_PATTERN.groupindex if name != "SYMBOL"
+}
+
 
 class Tokenizer:
     """
@@ -21,8 +53,17 @@ class Tokenizer:
             self.file.name if hasattr(self.file, "name") else "<string>"
         )
 
-        self.buffer: list[str] = []
+        # characters are stored as read, i.e. the end of the file is ""
+        self.buffer: collections.deque[str] = collections.deque()
         self.read = io.StringIO()
+        self.file_proxy: typing.Final = FileProxy(
+            self.file_name,
+            self.read,
+            LineIndex(self.read),
+        )
+
+        # characters of the token being scanned
+        self.lexeme: list[str] = []
 
         self.start = self.current = 0
 
@@ -59,14 +100,15 @@ class Tokenizer:
             char = self.file.read(1)
 
             self.read.write(char)
-            self.buffer.append(char or "\0")
+            self.buffer.append(char)
 
-        return self.buffer[distance]
+        return self.buffer[distance] or "\0"
 
     def sync_head(self) -> None:
         """Prepare `start` for a new token."""
 
         self.start = self.current
+        self.lexeme.clear()
 
     def advance(self, steps: int = 1, /) -> None:
         """
@@ -101,7 +143,10 @@ class Tokenizer:
         _ = self.peek()
         self.advance()
 
-        return self.buffer.pop(0)
+        char = self.buffer.popleft()
+        self.lexeme.append(char)
+
+        return char or "\0"
 
     # TODO: support non-decimal bases (binary, hexadecimal)
     def scan_number(self) -> TokenType:
@@ -212,7 +257,7 @@ class Tokenizer:
             The lexeme of the currently scanned token.
         """
 
-        return self.read.getvalue()[self.start : self.current]
+        return "".join(self.lexeme)
 
     def build_token(self, token_type: TokenType) -> Token:
         """
@@ -230,7 +275,7 @@ class Tokenizer:
             token_type,
             self.get_lexeme(),
             Span(self.start, self.current),
-            FileProxy(self.file_name, self.read),
+            self.file_proxy,
         )
 
     def run(self) -> collections.abc.Generator[Token, None, None]:
@@ -250,3 +295,167 @@ class Tokenizer:
 
         while True:
             yield self.build_token(TokenType.EOF)
+
+    def run_compact(self) -> TokenStream:
+        """
+        Tokenize the whole source at once.
+
+        Returns
+        -------
+        TokenStream
+            The compact storage of the produced tokens, the last one being
+            the end-of-file token.
+        """
+
+        lexemes: list[str] = []
+        # the index of each distinct lexeme in `lexemes`
+        lexeme_pool: dict[str, int] = {}
+
+        types = array.array("B")
+        starts = array.array("q")
+        lexeme_indexes = array.array("I")
+
+        for token in self.run():
+            lexeme_index = lexeme_pool.setdefault(token.lexeme, len(lexemes))
+
+            if lexeme_index == len(lexemes):
+                lexemes.append(token.lexeme)
+
+            types.append(token.type.value)
+            starts.append(token.span.start)
+            lexeme_indexes.append(lexeme_index)
+
+            if token.type is TokenType.EOF:
+                break
+
+        return TokenStream(self.file_proxy, lexemes, types, starts, lexeme_indexes)
+
+
+class BufferedTokenizer(Tokenizer):
+    """
+    A tokenizer that reads the source in large chunks and scans it by index,
+    instead of reading it one character at a time.
+
+    It produces exactly the same tokens as `Tokenizer`, and is lazy as well.
+    """
+
+    DEFAULT_CHUNK_SIZE = 0x100000
+
+    def __init__(
+        self,
+        file: typing.TextIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(file)
+
+        self.chunk_size: typing.Final = chunk_size
+
+        # `window` holds the source from `window_start` onwards ; the part
+        # preceding the token being scanned is dropped when a chunk is read
+        self.window = ""
+        self.window_start = 0
+
+    def read_chunk(self) -> bool:
+        """
+        Read the next chunk of the source into the window.
+
+        Returns
+        -------
+        bool
+            `False` if the end of the file was reached, else `True`.
+        """
+
+        chunk = self.file.read(self.chunk_size)
+
+        if not chunk:
+            return False
+
+        self.read.write(chunk)
+
+        self.window = self.window[self.start - self.window_start :] + chunk
+        self.window_start = self.start
+
+        return True
+
+    @typing.override
+    def peek(self, distance: int = 0, /) -> str:
+        if distance < 0:
+            raise ValueError("n must be positive")
+
+        index = self.current + distance - self.window_start
+
+        while index >= len(self.window):
+            if not self.read_chunk():
+                return "\0"
+
+            index = self.current + distance - self.window_start
+
+        return self.window[index]
+
+    @typing.override
+    def consume(self) -> str:
+        char = self.peek()
+        self.advance()
+
+        return char
+
+    @typing.override
+    def get_lexeme(self) -> str:
+        return self.window[
+            self.start - self.window_start : self.current - self.window_start
+        ]
+
+
+class RegexTokenizer(BufferedTokenizer):
+    """
+    A tokenizer that scans each token with a single match of a compiled
+    master pattern, rather than branching on every character.
+
+    Apart from the end-of-file tokens, which always span the end of the
+    source, it produces the same tokens as `Tokenizer`.
+    """
+
+    @typing.override
+    def run(self) -> collections.abc.Generator[Token, None, None]:
+        match_token = TOKEN_PATTERN.match
+
+        while True:
+            self.sync_head()
+
+            match = match_token(self.window, self.current - self.window_start)
+
+            # the token might go on in the next chunk
+            if (match is None or match.end() == len(self.window)) and self.read_chunk():
+                continue
+
+            if match is None:
+                self.current = self.window_start + len(self.window)
+                break
+
+            group = typing.cast(str, match.lastgroup)
+            start, end = match.span(group)
+
+            self.start = self.window_start + start
+            self.current = self.window_start + end
+
+            match group:
+                case "EOF":
+                    self.current = self.start
+                    break
+                case "SYMBOL" if not match.group(group)[0].isalpha():
+                    self.current = self.start + 1
+                    token_type = TokenType.INVALID
+                case "SYMBOL":
+                    token_type = KEYWORD_LEXEMES.get(
+                        match.group(group),
+                        TokenType.INVALID,
+                    )
+                case _:
+                    token_type = GROUP_TOKEN_TYPES[group]
+
+            yield self.build_token(token_type)
+
+        self.sync_head()
+
+        while True:
+            yield self.build_token(TokenType.EOF)
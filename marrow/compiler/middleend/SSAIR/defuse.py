@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import collections.abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from marrow.types import MemoryAddress
+
+    from .instruction import IRInstruction
+
+
+class DefUseIndex:
+    """
+    Def-use and use-def chains of an SSA IR list, built once.
+
+    Since every location is defined once, a location maps to the single
+    instruction defining it, and to the instructions reading it, in order.
+    The index is not updated if the list changes.
+    """
+
+    def __init__(self, ir: collections.abc.Iterable[IRInstruction]) -> None:
+        self.definitions: dict[MemoryAddress, IRInstruction] = {}
+        self.users: dict[MemoryAddress, list[IRInstruction]] = {}
+
+        for instruction in ir:
+            self.definitions[instruction.destination] = instruction
+
+            for location in instruction.get_operands():
+                self.users.setdefault(location, []).append(instruction)
+
+    def get_definition(self, location: MemoryAddress) -> IRInstruction | None:
+        """
+        Parameters
+        ----------
+        location : MemoryAddress
+
+        Returns
+        -------
+        IRInstruction | None
+            The instruction defining the location, if any.
+        """
+
+        return self.definitions.get(location)
+
+    def get_users(
+        self,
+        location: MemoryAddress,
+    ) -> collections.abc.Sequence[IRInstruction]:
+        """
+        Parameters
+        ----------
+        location : MemoryAddress
+
+        Returns
+        -------
+        Sequence[IRInstruction]
+            The instructions reading the location. An instruction reading it
+            twice appears twice.
+        """
+
+        return self.users.get(location, ())
+
+    def get_use_count(self, location: MemoryAddress) -> int:
+        """
+        Parameters
+        ----------
+        location : MemoryAddress
+
+        Returns
+        -------
+        int
+            How many times the location is read.
+        """
+
+        return len(self.get_users(location))
+
+    def is_used(self, location: MemoryAddress) -> bool:
+        """
+        Parameters
+        ----------
+        location : MemoryAddress
+
+        Returns
+        -------
+        bool
+            Whether the location is read by any instruction.
+        """
+
+        return location in self.users
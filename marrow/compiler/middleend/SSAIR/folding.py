@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import collections
+import typing
+
+from marrow.compiler.backend.funcs import BINOP_FUNC_MAPPING
+from marrow.compiler.backend.funcs import UNOP_FUNC_MAPPING
+from marrow.compiler.common import Token
+from marrow.compiler.common import TokenType
+from marrow.compiler.frontend.token import Span
+from marrow.runtime.alu.alu import ArithmeticLogicUnit
+from marrow.runtime.alu.op import BINOP_MAPPING
+from marrow.runtime.alu.op import UNOP_MAPPING
+
+from .defuse import DefUseIndex
+from .instruction import IRInstruction
+from .rvalue import AtomRValue
+from .rvalue import BinaryRValue
+from .rvalue import UnaryRValue
+
+if typing.TYPE_CHECKING:
+    from marrow.tooling import GlobalTooling
+    from marrow.types import MemoryAddress
+
+
+class ConstantFolder:
+    """
+    Folds the arithmetic on integer literals of the SSA IR into literals.
+
+    Operations are evaluated by the ALU of the runtime, so that the folded
+    value is the one the program would compute. Those that raise a flag of the
+    ALU, such as an overflow or a division by zero, are left to the runtime.
+
+    The literals only used by folded operations are removed.
+    """
+
+    def __init__(self, tooling: GlobalTooling) -> None:
+        self.alu = ArithmeticLogicUnit(tooling)
+
+        self.tooling = tooling
+
+    def make_token(self, value: bytearray, start: Token, end: Token) -> Token:
+        """
+        Make the token of a folded literal.
+
+        Parameters
+        ----------
+        value : bytearray
+            The encoded value of the literal.
+        start : Token
+            The token of the first operand.
+        end : Token
+            The token of the last operand.
+
+        Returns
+        -------
+        Token
+            An integer token spanning the operands, whose lexeme is the value.
+        """
+
+        return Token(
+            TokenType.INTEGER,
+            str(self.tooling.endec.decode_integer(value)),
+            Span(start.span.start, end.span.end),
+            start.file,
+        )
+
+    def fold(self, ir: list[IRInstruction]) -> list[IRInstruction]:
+        """
+        Parameters
+        ----------
+        ir : list[IRInstruction]
+            The SSA IR to optimize.
+
+        Returns
+        -------
+        list[IRInstruction]
+            The SSA IR with its constant operations folded.
+        """
+
+        constants: dict[MemoryAddress, tuple[bytearray, Token]] = {}
+        index = DefUseIndex(ir)
+        folded_uses: collections.Counter[MemoryAddress] = collections.Counter()
+        instructions: list[IRInstruction] = []
+
+        for instruction in ir:
+            destination, rvalue = instruction
+
+            match rvalue:
+                case AtomRValue(token) if token.type is TokenType.INTEGER:
+                    value = self.tooling.endec.encode_integer(int(token.lexeme))
+                    constants[destination] = (value, token)
+                    instructions.append(instruction)
+
+                    continue
+                case BinaryRValue(kind, left, right) if (
+                    left in constants and right in constants
+                ):
+                    (left_value, left_token) = constants[left]
+                    (right_value, right_token) = constants[right]
+                    op = BINOP_MAPPING[BINOP_FUNC_MAPPING[kind]](
+                        left_value,
+                        right_value,
+                    )
+                    tokens = (left_token, right_token)
+                case UnaryRValue(kind, right) if right in constants:
+                    (right_value, right_token) = constants[right]
+                    op = UNOP_MAPPING[UNOP_FUNC_MAPPING[kind]](right_value)
+                    tokens = (right_token, right_token)
+                case _:
+                    instructions.append(instruction)
+
+                    continue
+
+            value = self.alu.execute(op)
+
+            if self.alu.flags:
+                instructions.append(instruction)
+
+                continue
+
+            token = self.make_token(value, *tokens)
+            constants[destination] = (value, token)
+            instructions.append(IRInstruction(destination, AtomRValue(token)))
+
+            folded_uses.update(instruction.get_operands())
+
+        # the locations only read by folded operations are no longer needed
+        unused = {
+            location
+            for location, count in folded_uses.items()
+            if count == index.get_use_count(location)
+        }
+
+        return [
+            instruction
+            for instruction in instructions
+            if instruction.destination not in unused
+        ]
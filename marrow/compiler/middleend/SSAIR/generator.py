@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing
 
 from marrow.compiler.frontend.ast import expr
+from marrow.compiler.frontend.ast import traversal
 
 from .instruction import IRInstruction
 from .rvalue import AtomRValue
@@ -14,25 +15,30 @@ if typing.TYPE_CHECKING:
 
 
 class IRGenerator(expr.ExprVisitor[None]):
+    """
+    Generates the SSA IR of a parse tree.
+
+    Nodes are visited in post-order, so the locations of the operands of an
+    expression are already allocated when it is visited.
+    """
+
     def __init__(self) -> None:
         self.instructions: list[IRInstruction] = []
-        self.expr_registers: dict[expr.Expr, MemoryAddress] = {}
+        # keyed by node identity, as hashing a node hashes its whole subtree
+        self.expr_registers: dict[int, MemoryAddress] = {}
         self.location = 0
 
     def allocate_location(self, expr: expr.Expr) -> MemoryAddress:
         location = self.location
 
-        self.expr_registers[expr] = location
+        self.expr_registers[id(expr)] = location
         self.location += 1
 
         return location
 
     def visit_binary_expr(self, expression: expr.BinaryExpr) -> None:
-        expression.left.accept(self)
-        expression.right.accept(self)
-
-        left = self.expr_registers[expression.left]
-        right = self.expr_registers[expression.right]
+        left = self.expr_registers[id(expression.left)]
+        right = self.expr_registers[id(expression.right)]
         destination = self.allocate_location(expression)
 
         rvalue = BinaryRValue(expression.operator, left, right)
@@ -41,11 +47,13 @@ class IRGenerator(expr.ExprVisitor[None]):
         self.instructions.append(instruction)
 
     def visit_block_expr(self, expression: expr.BlockExpr) -> None:
-        for subexpr in expression.expr_list:
-            subexpr.accept(self)
+        pass
 
     def visit_grouping_expr(self, expression: expr.GroupingExpr) -> None:
-        expression.grouped.accept(self)
+        # a grouping is its inner expression
+        self.expr_registers[id(expression)] = self.expr_registers[
+            id(expression.grouped)
+        ]
 
     def visit_invalid_expr(self, expression: expr.InvalidExpr) -> None:
         raise TypeError("found invalid expression while generating SSA IR")
@@ -57,12 +65,10 @@ class IRGenerator(expr.ExprVisitor[None]):
         self.instructions.append(instruction)
 
     def visit_mod_expr(self, expression: expr.ModExpr) -> None:
-        expression.expr.accept(self)
+        pass
 
     def visit_unary_expr(self, expression: expr.UnaryExpr) -> None:
-        expression.operand.accept(self)
-
-        right = self.expr_registers[expression.operand]
+        right = self.expr_registers[id(expression.operand)]
         destination = self.allocate_location(expression)
 
         rvalue = UnaryRValue(expression.operator, right)
@@ -73,6 +79,7 @@ class IRGenerator(expr.ExprVisitor[None]):
     def generate(self, expr: expr.Expr) -> list[IRInstruction]:
         self.instructions.clear()
 
-        expr.accept(self)
+        for node in traversal.iter_postorder(expr):
+            node.accept(self)
 
         return self.instructions
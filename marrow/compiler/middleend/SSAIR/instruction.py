@@ -16,7 +16,28 @@ class IRInstruction(typing.NamedTuple):
     destination: MemoryAddress
     rvalue: RValue
 
+    def get_operands(self) -> tuple[MemoryAddress, ...]:
+        """
+        Returns
+        -------
+        tuple[MemoryAddress, ...]
+            The locations read by the instruction.
+        """
+
+        match self.rvalue:
+            case AtomRValue(_):
+                return ()
+            case BinaryRValue(_, left, right):
+                return (left, right)
+            case UnaryRValue(_, right):
+                return (right,)
+
     def is_dependent_on(self, location: MemoryAddress) -> bool:
+        """
+        Whether the instruction reads the location. To query many locations,
+        build a `DefUseIndex` instead.
+        """
+
         match self.rvalue:
             case AtomRValue(_):
                 return False
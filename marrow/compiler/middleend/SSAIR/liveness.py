@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import typing
+
+from marrow.compiler.common import TokenType
+
+from .rvalue import BinaryRValue
+
+if typing.TYPE_CHECKING:
+    from marrow.compiler.common import BinaryOpTokenType
+    from marrow.types import MemoryAddress
+
+    from .instruction import IRInstruction
+    from .rvalue import RValue
+
+# the runtime reports the overflows of these operations
+OVERFLOWING_OPERATORS: typing.Final[frozenset[BinaryOpTokenType]] = frozenset(
+    {TokenType.PLUS, TokenType.STAR},
+)
+
+
+class DeadCodeEliminator:
+    """
+    Removes the instructions of the SSA IR whose value is never used.
+
+    Blocks do not read the values of their statements, so the only
+    instructions that matter are those with an effect, i.e. the operations
+    whose overflow is reported by the runtime, and the ones they depend on.
+    """
+
+    def __init__(self) -> None:
+        self.eliminated_count = 0
+
+    def has_side_effect(self, rvalue: RValue) -> bool:
+        """
+        Parameters
+        ----------
+        rvalue : RValue
+
+        Returns
+        -------
+        bool
+            Whether evaluating the rvalue can be observed other than through
+            its location.
+        """
+
+        return isinstance(rvalue, BinaryRValue) and rvalue.kind in OVERFLOWING_OPERATORS
+
+    def eliminate(self, ir: list[IRInstruction]) -> list[IRInstruction]:
+        """
+        Parameters
+        ----------
+        ir : list[IRInstruction]
+            The SSA IR to optimize.
+
+        Returns
+        -------
+        list[IRInstruction]
+            The SSA IR without the dead instructions.
+        """
+
+        live: set[MemoryAddress] = set()
+        instructions: list[IRInstruction] = []
+
+        # in SSA form, a location is defined before it is used, so a single
+        # backward pass finds every live location
+        for instruction in reversed(ir):
+            if instruction.destination in live or self.has_side_effect(
+                instruction.rvalue,
+            ):
+                live.update(instruction.get_operands())
+                instructions.append(instruction)
+
+        instructions.reverse()
+
+        self.eliminated_count = len(ir) - len(instructions)
+
+        return instructions
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import typing
+
+import attrs
+
+from marrow.compiler.common import TokenType
+
+from .instruction import IRInstruction
+from .rvalue import AtomRValue
+from .rvalue import BinaryRValue
+from .rvalue import UnaryRValue
+
+if typing.TYPE_CHECKING:
+    from marrow.compiler.common import BinaryOpTokenType
+    from marrow.types import MemoryAddress
+
+    from .rvalue import RValue
+
+COMMUTATIVE_OPERATORS: typing.Final[frozenset[BinaryOpTokenType]] = frozenset(
+    {TokenType.PLUS, TokenType.STAR},
+)
+
+type ValueKey = tuple[object, ...]
+"""Key under which equal rvalues are numbered."""
+
+
+@attrs.define
+class EliminationStats:
+    """
+    Statistics of a common subexpression elimination.
+
+    Attributes
+    ----------
+    instruction_count : int
+        The number of instructions before the elimination.
+    eliminated_atoms : int
+        The number of literals that were eliminated.
+    eliminated_operations : int
+        The number of unary and binary operations that were eliminated.
+    """
+
+    instruction_count: int = 0
+    eliminated_atoms: int = 0
+    eliminated_operations: int = 0
+
+    @property
+    def eliminated_count(self) -> int:
+        return self.eliminated_atoms + self.eliminated_operations
+
+
+class CommonSubexpressionEliminator:
+    """
+    Removes the instructions of the SSA IR that compute a value already
+    computed, using value numbering.
+
+    Literals are equal if they have the same type and lexeme, operations if
+    they have the same operator and operands, in any order for commutative
+    operators. The uses of an eliminated instruction read the location of the
+    first one instead.
+    """
+
+    def __init__(self) -> None:
+        self.stats = EliminationStats()
+
+    def get_key(self, rvalue: RValue) -> ValueKey:
+        """
+        Parameters
+        ----------
+        rvalue : RValue
+            An rvalue whose operands are already numbered.
+
+        Returns
+        -------
+        ValueKey
+            The key shared by the rvalues computing the same value.
+        """
+
+        match rvalue:
+            case AtomRValue(token):
+                return (token.type, token.lexeme)
+            case BinaryRValue(kind, left, right):
+                if kind in COMMUTATIVE_OPERATORS and right < left:
+                    left, right = right, left
+
+                return (kind, left, right)
+            case UnaryRValue(kind, right):
+                return (kind, right)
+
+    def eliminate(self, ir: list[IRInstruction]) -> list[IRInstruction]:
+        """
+        Parameters
+        ----------
+        ir : list[IRInstruction]
+            The SSA IR to optimize.
+
+        Returns
+        -------
+        list[IRInstruction]
+            The SSA IR without the redundant instructions.
+        """
+
+        self.stats = EliminationStats(len(ir))
+
+        numbers: dict[ValueKey, MemoryAddress] = {}
+        aliases: dict[MemoryAddress, MemoryAddress] = {}
+        instructions: list[IRInstruction] = []
+
+        for destination, rvalue in ir:
+            match rvalue:
+                case BinaryRValue(kind, left, right):
+                    rvalue = BinaryRValue(
+                        kind,
+                        aliases.get(left, left),
+                        aliases.get(right, right),
+                    )
+                case UnaryRValue(kind, right):
+                    rvalue = UnaryRValue(kind, aliases.get(right, right))
+                case AtomRValue(_):
+                    pass
+
+            key = self.get_key(rvalue)
+            location = numbers.get(key)
+
+            if location is None:
+                numbers[key] = destination
+                instructions.append(IRInstruction(destination, rvalue))
+            else:
+                aliases[destination] = location
+
+                if isinstance(rvalue, AtomRValue):
+                    self.stats.eliminated_atoms += 1
+                else:
+                    self.stats.eliminated_operations += 1
+
+        return instructions
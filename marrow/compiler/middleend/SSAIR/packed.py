@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import array
+import collections.abc
+import enum
+import typing
+
+from marrow.compiler.common import TokenType
+
+from .instruction import IRInstruction
+from .rvalue import AtomRValue
+from .rvalue import BinaryRValue
+from .rvalue import UnaryRValue
+
+if typing.TYPE_CHECKING:
+    from marrow.compiler.common import BinaryOpTokenType
+    from marrow.compiler.common import Token
+    from marrow.compiler.common import UnaryOpTokenType
+    from marrow.types import MemoryAddress
+
+    from .rvalue import RValue
+
+
+class IROpcode(enum.IntEnum):
+    ATOM = enum.auto()
+
+    ADD = enum.auto()
+    SUB = enum.auto()
+    MUL = enum.auto()
+    DIV = enum.auto()
+    MOD = enum.auto()
+
+    POS = enum.auto()
+    NEG = enum.auto()
+
+
+BINARY_OPCODE_MAPPING: dict[BinaryOpTokenType, IROpcode] = {
+    TokenType.MINUS: IROpcode.SUB,
+    TokenType.PERCENT: IROpcode.MOD,
+    TokenType.PLUS: IROpcode.ADD,
+    TokenType.SLASH: IROpcode.DIV,
+    TokenType.STAR: IROpcode.MUL,
+}
+
+UNARY_OPCODE_MAPPING: dict[UnaryOpTokenType, IROpcode] = {
+    TokenType.MINUS: IROpcode.NEG,
+    TokenType.PLUS: IROpcode.POS,
+}
+
+BINARY_KIND_MAPPING: dict[IROpcode, BinaryOpTokenType] = {
+    opcode: kind for kind, opcode in BINARY_OPCODE_MAPPING.items()
+}
+UNARY_KIND_MAPPING: dict[IROpcode, UnaryOpTokenType] = {
+    opcode: kind for kind, opcode in UNARY_OPCODE_MAPPING.items()
+}
+
+NO_OPERAND: typing.Final = -1
+"""Operand column value of the instructions reading fewer locations."""
+
+
+class PackedIR:
+    """
+    Compact storage of an SSA IR list.
+
+    Instructions are stored as a structure of arrays (opcodes, destinations,
+    left and right operands). The operand columns of a literal hold the index
+    of its token in the constant pool, and `NO_OPERAND`. A unary operation
+    only has a right operand, its left column being `NO_OPERAND`.
+
+    `IRInstruction` objects are only built when accessed.
+    """
+
+    def __init__(
+        self,
+        opcodes: array.array[int],
+        destinations: array.array[int],
+        lefts: array.array[int],
+        rights: array.array[int],
+        constants: list[Token],
+    ) -> None:
+        self.opcodes: typing.Final = opcodes
+        self.destinations: typing.Final = destinations
+        self.lefts: typing.Final = lefts
+        self.rights: typing.Final = rights
+
+        self.constants: typing.Final = constants
+
+    @classmethod
+    def from_instructions(
+        cls,
+        ir: collections.abc.Iterable[IRInstruction],
+    ) -> typing.Self:
+        """
+        Parameters
+        ----------
+        ir : Iterable[IRInstruction]
+            The SSA IR to pack.
+
+        Returns
+        -------
+        Self
+            The packed SSA IR. Equal tokens share their constant pool entry.
+        """
+
+        opcodes = array.array("B")
+        destinations = array.array("q")
+        lefts = array.array("q")
+        rights = array.array("q")
+
+        constants: list[Token] = []
+        constant_indexes: dict[Token, int] = {}
+
+        for destination, rvalue in ir:
+            match rvalue:
+                case AtomRValue(token):
+                    index = constant_indexes.get(token)
+
+                    if index is None:
+                        index = constant_indexes[token] = len(constants)
+                        constants.append(token)
+
+                    opcodes.append(IROpcode.ATOM)
+                    lefts.append(index)
+                    rights.append(NO_OPERAND)
+                case BinaryRValue(kind, left, right):
+                    opcodes.append(BINARY_OPCODE_MAPPING[kind])
+                    lefts.append(left)
+                    rights.append(right)
+                case UnaryRValue(kind, right):
+                    opcodes.append(UNARY_OPCODE_MAPPING[kind])
+                    lefts.append(NO_OPERAND)
+                    rights.append(right)
+
+            destinations.append(destination)
+
+        return cls(opcodes, destinations, lefts, rights, constants)
+
+    def to_instructions(self) -> list[IRInstruction]:
+        """
+        Returns
+        -------
+        list[IRInstruction]
+            The unpacked SSA IR.
+        """
+
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __getitem__(self, index: int) -> IRInstruction:
+        return IRInstruction(self.destinations[index], self.get_rvalue(index))
+
+    def __iter__(self) -> collections.abc.Generator[IRInstruction, None, None]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def get_rvalue(self, index: int) -> RValue:
+        opcode = IROpcode(self.opcodes[index])
+
+        if opcode is IROpcode.ATOM:
+            return AtomRValue(self.constants[self.lefts[index]])
+
+        if opcode in BINARY_KIND_MAPPING:
+            return BinaryRValue(
+                BINARY_KIND_MAPPING[opcode],
+                self.lefts[index],
+                self.rights[index],
+            )
+
+        return UnaryRValue(UNARY_KIND_MAPPING[opcode], self.rights[index])
+
+    def get_operands(self, index: int) -> tuple[MemoryAddress, ...]:
+        """
+        Parameters
+        ----------
+        index : int
+            The index of the instruction.
+
+        Returns
+        -------
+        tuple[MemoryAddress, ...]
+            The locations read by the instruction, as
+            `IRInstruction.get_operands` does.
+        """
+
+        if self.opcodes[index] == IROpcode.ATOM:
+            return ()
+
+        if self.lefts[index] == NO_OPERAND:
+            return (self.rights[index],)
+
+        return (self.lefts[index], self.rights[index])
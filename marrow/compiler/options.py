@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import typing
+
+import attrs
+
+from marrow.compiler.components import BufferedTokenizer
+from marrow.compiler.components import RegexTokenizer
+from marrow.compiler.components import Tokenizer
+
+TOKENIZER_MAPPING: dict[str, type[Tokenizer]] = {
+    "stream": Tokenizer,
+    "buffered": BufferedTokenizer,
+    "regex": RegexTokenizer,
+}
+
+
+@attrs.frozen
+class CompilerOptions:
+    """
+    Options tweaking how the compiler works.
+
+    Attributes
+    ----------
+    tokenizer : type[Tokenizer]
+        The tokenizer implementation used to scan the source.
+    compact_tokens : bool
+        Whether the source is tokenized at once into a compact token stream,
+        rather than lazily.
+    iterative_parser : bool
+        Whether expressions are parsed with an explicit stack rather than
+        recursively, which supports arbitrarily deep nesting.
+    max_errors : int | None
+        The number of errors after which the compiler stops parsing, if any.
+    optimization_level : int
+        The level of the optimization passes to run, from 0 (none) to 2.
+    fold_constants : bool
+        Whether the arithmetic on literals is evaluated at compile time.
+    eliminate_common_subexpressions : bool
+        Whether the values computed several times are only computed once.
+    eliminate_dead_code : bool
+        Whether the values that are never used are not computed. It is
+        ignored in debug mode, so that the heap dump shows every value.
+    compact_heap : bool
+        Whether the heap slots of the values that are dead are reused. It is
+        ignored in debug mode, so that the heap dump shows every value.
+    peephole : bool
+        Whether the macro ops that do not change the state of the machine
+        are removed.
+    packed_ir : bool
+        Whether the optimized SSA IR is packed into arrays before being
+        lowered to macro ops.
+    """
+
+    tokenizer: type[Tokenizer] = BufferedTokenizer
+    compact_tokens: bool = False
+    iterative_parser: bool = False
+    max_errors: int | None = None
+    optimization_level: int = 2
+    fold_constants: bool = True
+    eliminate_common_subexpressions: bool = True
+    eliminate_dead_code: bool = True
+    compact_heap: bool = True
+    peephole: bool = True
+    packed_ir: bool = False
+
+    @classmethod
+    def from_args(cls, namespace: argparse.Namespace) -> typing.Self:
+        return cls(
+            tokenizer=TOKENIZER_MAPPING[namespace.tokenizer],
+            compact_tokens=namespace.compact_tokens,
+            iterative_parser=namespace.iterative_parser,
+            max_errors=namespace.max_errors,
+            optimization_level=namespace.optimization_level,
+            fold_constants=namespace.fold_constants,
+            eliminate_common_subexpressions=namespace.eliminate_common_subexpressions,
+            eliminate_dead_code=namespace.eliminate_dead_code,
+            compact_heap=namespace.compact_heap,
+            peephole=namespace.peephole,
+            packed_ir=namespace.packed_ir,
+        )
@@ -0,0 +1,226 @@
+"""
+Management of the optimization passes of the compiler.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import io
+import time
+import tracemalloc
+import typing
+
+import attrs
+
+type PassFunction[T] = collections.abc.Callable[[list[T]], list[T]]
+
+
+@attrs.frozen
+class Pass[T]:
+    """
+    An optimization pass over a list of instructions.
+
+    Attributes
+    ----------
+    name : str
+        The name of the pass, used to toggle and order it.
+    function : PassFunction[T]
+        Returns the optimized instructions.
+    level : int
+        The minimum optimization level at which the pass runs.
+    """
+
+    name: str
+    function: PassFunction[T]
+    level: int = 1
+
+
+@attrs.frozen
+class PassReport:
+    """
+    Measurements of a pass run.
+
+    Attributes
+    ----------
+    name : str
+        The name of the pass.
+    duration : float
+        The wall time taken by the pass, in seconds.
+    count_before : int
+        The number of instructions given to the pass.
+    count_after : int
+        The number of instructions returned by the pass.
+    memory : int
+        The peak memory allocated during the pass, in bytes.
+    """
+
+    name: str
+    duration: float
+    count_before: int
+    count_after: int
+    memory: int
+
+
+class PassManager[T]:
+    """
+    Runs registered passes in order, and measures them if asked to.
+
+    A pass runs if the optimization level is at least its own, and if it has
+    not been disabled.
+    """
+
+    def __init__(self, kind: str) -> None:
+        self.kind: typing.Final = kind
+        self.passes: list[Pass[T]] = []
+        self.disabled: set[str] = set()
+        self.reports: list[PassReport] = []
+
+    def register(
+        self,
+        name: str,
+        function: PassFunction[T],
+        *,
+        level: int = 1,
+        before: str | None = None,
+    ) -> None:
+        """
+        Register a pass.
+
+        Parameters
+        ----------
+        name : str
+        function : PassFunction[T]
+        level : int, optional
+            The minimum optimization level at which the pass runs.
+        before : str, optional
+            The name of a registered pass that this one must precede. By
+            default, the pass is run after the ones already registered.
+        """
+
+        if any(registered.name == name for registered in self.passes):
+            raise ValueError(f"pass {name!r} is already registered")
+
+        index = len(self.passes)
+
+        if before is not None:
+            index = self.get_index(before)
+
+        self.passes.insert(index, Pass(name, function, level))
+
+    def get_index(self, name: str) -> int:
+        for index, registered in enumerate(self.passes):
+            if registered.name == name:
+                return index
+
+        raise ValueError(f"no pass named {name!r}")
+
+    def set_enabled(self, name: str, enabled: bool) -> None:
+        """
+        Enable or disable a registered pass.
+
+        Parameters
+        ----------
+        name : str
+        enabled : bool
+        """
+
+        self.get_index(name)
+
+        if enabled:
+            self.disabled.discard(name)
+        else:
+            self.disabled.add(name)
+
+    def get_scheduled(self, level: int) -> list[Pass[T]]:
+        """
+        Parameters
+        ----------
+        level : int
+            The optimization level.
+
+        Returns
+        -------
+        list[Pass[T]]
+            The passes to run at this level, in order.
+        """
+
+        return [
+            registered
+            for registered in self.passes
+            if registered.level <= level and registered.name not in self.disabled
+        ]
+
+    def run(self, instructions: list[T], level: int, *, profile: bool) -> list[T]:
+        """
+        Run the scheduled passes.
+
+        Parameters
+        ----------
+        instructions : list[T]
+        level : int
+            The optimization level.
+        profile : bool
+            Whether each pass is measured, into `reports`. Memory is traced
+            while it runs, which slows it down.
+
+        Returns
+        -------
+        list[T]
+            The optimized instructions.
+        """
+
+        self.reports.clear()
+
+        for scheduled in self.get_scheduled(level):
+            if not profile:
+                instructions = scheduled.function(instructions)
+                continue
+
+            count_before = len(instructions)
+
+            is_tracing = tracemalloc.is_tracing()
+
+            if not is_tracing:
+                tracemalloc.start()
+
+            tracemalloc.reset_peak()
+            memory_start, _ = tracemalloc.get_traced_memory()
+            time_start = time.perf_counter()
+
+            instructions = scheduled.function(instructions)
+
+            time_end = time.perf_counter()
+            _, memory_peak = tracemalloc.get_traced_memory()
+
+            if not is_tracing:
+                tracemalloc.stop()
+
+            self.reports.append(
+                PassReport(
+                    scheduled.name,
+                    time_end - time_start,
+                    count_before,
+                    len(instructions),
+                    memory_peak - memory_start,
+                ),
+            )
+
+        return instructions
+
+    def make_report_log(self) -> str:
+        buffer = io.StringIO()
+
+        print(f"{self.kind} passes", file=buffer)
+
+        if not self.reports:
+            print("• none", file=buffer)
+
+        for report in self.reports:
+            print(
+                f"• {report.name}: {report.duration:.4f}s, "
+                f"{report.count_before} -> {report.count_after} instructions, "
+                f"{report.memory / 1024:.1f} KiB",
+                file=buffer,
+            )
+
+        return buffer.getvalue().removesuffix("\n")
@@ -3,12 +3,14 @@ from __future__ import annotations
 import typing
 
 from marrow.compiler.backend.macro.ops import BinaryArithmetic
+from marrow.compiler.backend.macro.ops import BinaryArithmeticImmediate
 from marrow.compiler.backend.macro.ops import MacroOpVisitor
 from marrow.compiler.backend.macro.ops import UnaryArithmetic
 
 if typing.TYPE_CHECKING:
     from marrow.compiler.backend.macro.ops import DumpHeap
     from marrow.compiler.backend.macro.ops import Load
+    from marrow.compiler.backend.macro.ops import LoadImmediate
     from marrow.compiler.backend.macro.ops import Store
     from marrow.compiler.backend.macro.ops import StoreImmediate
     from marrow.compiler.common import MacroOp
@@ -18,12 +20,23 @@ class MacroOpRenderer(MacroOpVisitor[str]):
     def visit_binary_arithmetic(self, op: BinaryArithmetic) -> str:
         return f"\x1b[1m{op.func.name:<16}\x1b[22m {op.destination:>#16x} {op.left:>#16x} {op.right:>#16x}"
 
+    def visit_binary_arithmetic_immediate(self, op: BinaryArithmeticImmediate) -> str:
+        immediate = int.from_bytes(op.immediate)
+        name = f"{op.func.name}IMM"
+
+        return f"\x1b[1m{name:<16}\x1b[22m {op.destination:>#16x} {op.left:>#16x} {immediate:>16}"
+
     def visit_dump_memory(self, op: DumpHeap) -> str:
         return f"\x1b[1m{'DUMP_MEMORY':<16}\x1b[22m {op.section_id:>#16x}"
 
     def visit_load(self, op: Load) -> str:
         return f"\x1b[1m{'LOAD':<16}\x1b[22m {op.destination:>#16x} {op.source:>#16x}"
 
+    def visit_load_immediate(self, op: LoadImmediate) -> str:
+        immediate = int.from_bytes(op.immediate)
+
+        return f"\x1b[1m{'LOADIMM':<16}\x1b[22m {op.destination:>#16x} {immediate:>16}"
+
     def visit_store(self, op: Store) -> str:
         return f"\x1b[1m{'STORE':<16}\x1b[22m {op.destination:>#16x} {op.source:>#16x}"
 
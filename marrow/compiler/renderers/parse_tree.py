@@ -6,6 +6,7 @@ import attrs
 from marrow.compiler.common import Token
 from marrow.compiler.common import TokenType
 from marrow.compiler.frontend.ast import expr
+from marrow.compiler.frontend.ast import traversal
 
 type NodeAttributeType = TokenType | Token | expr.Expr | list[expr.Expr] | str
 
@@ -13,6 +14,13 @@ type NodeAttributeType = TokenType | Token | expr.Expr | list[expr.Expr] | str
 @attrs.frozen
 class ParseTreeRenderer(expr.ExprVisitor[str]):
     indent_size: int = 4
+    # renderings of the sub-nodes, waiting for their parent to be rendered
+    _renderings: dict[int, str] = attrs.field(
+        factory=dict,
+        init=False,
+        repr=False,
+        eq=False,
+    )
 
     @typing.overload
     def render_node_attribute(self, name: str, expression: expr.Expr, /) -> str: ...
@@ -56,7 +64,11 @@ class ParseTreeRenderer(expr.ExprVisitor[str]):
     def _render_attribute_node(self, expression: expr.Expr, indents: int = 0) -> str:
         buffer = io.StringIO()
 
-        expr_repr = expression.accept(self)
+        expr_repr = self._renderings.pop(id(expression), None)
+
+        if expr_repr is None:
+            expr_repr = expression.accept(self)
+
         first, *lines = expr_repr.splitlines()
 
         print(" " * self.indent_size * indents + f"{first}", file=buffer)
@@ -123,8 +135,13 @@ class ParseTreeRenderer(expr.ExprVisitor[str]):
 
         print(f"\x1b[93m{expression.__class__.__name__}\x1b[39m(", file=buffer)
 
-        for key, value in expression.__dict__.items():
-            buffer.write(self.render_node_attribute(key, value))
+        for field in attrs.fields(type(expression)):
+            buffer.write(
+                self.render_node_attribute(
+                    field.name,
+                    getattr(expression, field.name),
+                ),
+            )
 
         print(")", file=buffer)
 
@@ -152,4 +169,9 @@ class ParseTreeRenderer(expr.ExprVisitor[str]):
         return self.visit_expr(expression)
 
     def render(self, expression: expr.Expr) -> str:
-        return expression.accept(self)
+        self._renderings.clear()
+
+        for node in traversal.iter_postorder(expression):
+            self._renderings[id(node)] = node.accept(self)
+
+        return self._renderings.pop(id(expression))
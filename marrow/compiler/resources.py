@@ -6,6 +6,7 @@ import typing
 import attrs
 
 from marrow.compiler.frontend.ast.expr import BlockExpr
+from marrow.compiler.frontend.ast.expr import InvalidExpr
 
 if typing.TYPE_CHECKING:
     from marrow.compiler.common import Expr
@@ -19,6 +20,7 @@ class CompilerResources:
     file: typing.TextIO
     tokens: collections.abc.Iterator[Token] = attrs.field(factory=lambda: iter(()))
     parse_tree: Expr = attrs.field(factory=lambda: BlockExpr([]))
+    invalid_nodes: list[InvalidExpr] = attrs.field(factory=list)
     ir: list[IRInstruction] = attrs.field(factory=list)
     macro_ops: list[MacroOp] = attrs.field(factory=list)
 
@@ -4,6 +4,7 @@ import sys
 import typing
 
 from marrow.compiler import Compiler
+from marrow.compiler import CompilerOptions
 from marrow.compiler.common import Bytecode
 from marrow.runtime.machine import Machine
 
@@ -11,13 +12,32 @@ from .tooling import GlobalTooling
 
 
 class Environment:
-    def __init__(self, *, verbose: bool, debug: bool) -> None:
+    def __init__(
+        self,
+        *,
+        verbose: bool,
+        debug: bool,
+        compiler_options: CompilerOptions | None = None,
+        jit: bool = False,
+        integer_registers: bool = False,
+        profile_memory: bool = False,
+    ) -> None:
         self.verbose: typing.Final = verbose
         self.debug: typing.Final = debug
 
         self.tooling = GlobalTooling.new(verbose=self.verbose)
-        self.compiler: typing.Final = Compiler(self.tooling, self.verbose, self.debug)
-        self.machine: typing.Final = Machine(self.tooling)
+        self.compiler: typing.Final = Compiler(
+            self.tooling,
+            self.verbose,
+            self.debug,
+            compiler_options,
+        )
+        self.machine: typing.Final = Machine(
+            self.tooling,
+            jit=jit,
+            integer_registers=integer_registers,
+            profile_memory=profile_memory,
+        )
 
         self.tooling.logger.info(
             self.make_setup_log(
@@ -34,6 +54,10 @@ class Environment:
         return cls(
             verbose=namespace.verbose,
             debug=namespace.debug,
+            compiler_options=CompilerOptions.from_args(namespace),
+            jit=namespace.jit,
+            integer_registers=namespace.integer_registers,
+            profile_memory=namespace.profile_memory,
         )
 
     def make_setup_log(self, *names: str) -> str:
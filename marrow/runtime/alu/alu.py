@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import collections.abc
 import enum
+import operator
 import typing
 
+from marrow.compiler.backend.funcs import BinaryArithmeticFunc
+from marrow.compiler.backend.funcs import UnaryArithmeticFunc
+from marrow.endec import INTEGER_MASK
 from marrow.runtime.alu.op import ALUOpVisitor
 
 if typing.TYPE_CHECKING:
@@ -23,6 +28,28 @@ class UnitFlags(enum.IntFlag):
     DIV_BY_ZERO = enum.auto()
 
 
+NO_FLAGS: typing.Final = UnitFlags(0)
+
+# the results are wrapped by `ArithmeticLogicUnit.compute`
+BINARY_FUNCS: typing.Final[
+    dict[BinaryArithmeticFunc, collections.abc.Callable[[int, int], int]]
+] = {
+    BinaryArithmeticFunc.ADD: operator.add,
+    BinaryArithmeticFunc.SUB: operator.sub,
+    BinaryArithmeticFunc.MUL: operator.mul,
+    BinaryArithmeticFunc.DIV: operator.floordiv,
+    BinaryArithmeticFunc.MOD: operator.mod,
+}
+DIVIDING_FUNCS: typing.Final = frozenset(
+    {BinaryArithmeticFunc.DIV, BinaryArithmeticFunc.MOD},
+)
+# unary functions are computed as binary ones, with a left operand of 0
+UNARY_FUNC_MAPPING: typing.Final = {
+    UnaryArithmeticFunc.NEG: BinaryArithmeticFunc.SUB,
+    UnaryArithmeticFunc.POS: BinaryArithmeticFunc.ADD,
+}
+
+
 class ArithmeticLogicUnit(ALUOpVisitor[bytearray]):
     def __init__(self, tooling: GlobalTooling) -> None:
         self.flags = UnitFlags(0)
@@ -94,3 +121,63 @@ class ArithmeticLogicUnit(ALUOpVisitor[bytearray]):
 
     def execute(self, op: ALUOp) -> bytearray:
         return op.accept(self)
+
+    def compute(
+        self,
+        func: BinaryArithmeticFunc,
+        left: int,
+        right: int,
+    ) -> tuple[int, UnitFlags]:
+        """
+        Compute a binary operation on decoded operands, without building an
+        op to visit.
+
+        Parameters
+        ----------
+        func : BinaryArithmeticFunc
+        left : int
+        right : int
+
+        Returns
+        -------
+        tuple[int, UnitFlags]
+            The result, wrapped as `execute` does, and the raised flags, which
+            are also set as `flags`.
+        """
+
+        if not right and func in DIVIDING_FUNCS:
+            self.flags = UnitFlags.DIV_BY_ZERO
+
+            return 0, UnitFlags.DIV_BY_ZERO
+
+        result = BINARY_FUNCS[func](left, right)
+
+        if result > INTEGER_MASK:
+            self.flags = UnitFlags.OVERFLOW
+
+            return result & INTEGER_MASK, UnitFlags.OVERFLOW
+
+        self.flags = NO_FLAGS
+
+        # subtractions wrap silently
+        return result & INTEGER_MASK, NO_FLAGS
+
+    def compute_unary(
+        self,
+        func: UnaryArithmeticFunc,
+        right: int,
+    ) -> tuple[int, UnitFlags]:
+        """
+        Compute a unary operation on a decoded operand, as `compute` does.
+
+        Parameters
+        ----------
+        func : UnaryArithmeticFunc
+        right : int
+
+        Returns
+        -------
+        tuple[int, UnitFlags]
+        """
+
+        return self.compute(UNARY_FUNC_MAPPING[func], 0, right)
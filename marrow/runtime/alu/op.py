@@ -83,6 +83,6 @@ BINOP_MAPPING: dict[BinaryArithmeticFunc, type[ALUOp]] = {
 type _PartialOp = collections.abc.Callable[[bytearray], ALUOp]
 
 UNOP_MAPPING: dict[UnaryArithmeticFunc, _PartialOp] = {
-    UnaryArithmeticFunc.NEG: functools.partial(Sub, 0),
-    UnaryArithmeticFunc.POS: functools.partial(Add, 0),
+    UnaryArithmeticFunc.NEG: functools.partial(Sub, bytearray(8)),
+    UnaryArithmeticFunc.POS: functools.partial(Add, bytearray(8)),
 }
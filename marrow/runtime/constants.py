@@ -1,3 +1,4 @@
 REGISTER_INDEXES = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15)
 REGISTER_SIZE = 8  # in bytes
 REGISTER_COUNT = len(REGISTER_INDEXES)
+HEAP_SIZE = 0x10000  # in bytes
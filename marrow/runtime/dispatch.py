@@ -0,0 +1,319 @@
+"""
+Threaded code: macro ops decoded into handlers, run by a tight loop.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+import struct
+import typing
+
+from marrow.compiler.backend.macro.ops import MacroOpVisitor
+from marrow.endec import INTEGER_FORMAT
+from marrow.runtime.alu.alu import UnitFlags
+from marrow.types import TYPE_SIZE_MAPPING
+
+from .constants import REGISTER_SIZE
+
+if typing.TYPE_CHECKING:
+    from marrow.compiler.backend.macro.ops import BinaryArithmetic
+    from marrow.compiler.backend.macro.ops import BinaryArithmeticImmediate
+    from marrow.compiler.backend.macro.ops import DumpHeap
+    from marrow.compiler.backend.macro.ops import Load
+    from marrow.compiler.backend.macro.ops import LoadImmediate
+    from marrow.compiler.backend.macro.ops import Pop
+    from marrow.compiler.backend.macro.ops import Push
+    from marrow.compiler.backend.macro.ops import Store
+    from marrow.compiler.backend.macro.ops import StoreImmediate
+    from marrow.compiler.backend.macro.ops import UnaryArithmetic
+    from marrow.compiler.common import MacroOp
+    from marrow.types import MemoryAddress
+    from marrow.types import RegisterNumber
+
+    from .machine import Machine
+
+type Handler = collections.abc.Callable[[], None]
+"""Executes a decoded macro op."""
+
+INTEGER_STRUCT: typing.Final = struct.Struct(INTEGER_FORMAT)
+
+
+class MacroOpDecoder(MacroOpVisitor[Handler]):
+    """
+    Decodes macro ops into handlers executing them on a machine.
+
+    The operands of an op are resolved once, when it is decoded, so that its
+    handler only does the work of the op. Handlers have the same effect as
+    the visitor methods of the machine, except that register accesses are
+    not tracked.
+    """
+
+    def __init__(self, machine: Machine) -> None:
+        self.machine: typing.Final = machine
+
+    def get_register_slice(self, number: RegisterNumber) -> slice:
+        index = self.machine.bank_mapping[number]
+
+        return slice(index, index + REGISTER_SIZE)
+
+    def get_heap_slice(self, address: MemoryAddress) -> slice:
+        start = address * REGISTER_SIZE
+
+        return slice(start, start + REGISTER_SIZE)
+
+    def visit_load(self, op: Load) -> Handler:
+        heap = self.machine.heap
+        register_file = self.machine.register_file
+        unpack_from = INTEGER_STRUCT.unpack_from
+        pack_into = INTEGER_STRUCT.pack_into
+        source = op.source * REGISTER_SIZE
+        destination = self.machine.bank_mapping[op.destination]
+
+        def load() -> None:
+            pack_into(register_file, destination, unpack_from(heap, source)[0])
+
+        return load
+
+    def visit_load_immediate(self, op: LoadImmediate) -> Handler:
+        register_file = self.machine.register_file
+        immediate = op.immediate
+        destination = self.get_register_slice(op.destination)
+
+        def load_immediate() -> None:
+            register_file[destination] = immediate
+
+        return load_immediate
+
+    def visit_store(self, op: Store) -> Handler:
+        heap = self.machine.heap
+        register_file = self.machine.register_file
+        unpack_from = INTEGER_STRUCT.unpack_from
+        pack_into = INTEGER_STRUCT.pack_into
+        source = self.machine.bank_mapping[op.source]
+        destination = op.destination * REGISTER_SIZE
+
+        def store() -> None:
+            pack_into(heap, destination, unpack_from(register_file, source)[0])
+
+        return store
+
+    def visit_store_immediate(self, op: StoreImmediate) -> Handler:
+        heap = self.machine.heap
+        immediate = op.immediate[len(op.immediate) - REGISTER_SIZE :]
+        destination = self.get_heap_slice(op.destination)
+
+        def store_immediate() -> None:
+            heap[destination] = immediate
+
+        return store_immediate
+
+    def visit_push(self, op: Push) -> Handler:
+        return functools.partial(
+            self.machine.push,
+            op.source,
+            TYPE_SIZE_MAPPING[op.type],
+        )
+
+    def visit_pop(self, op: Pop) -> Handler:
+        machine = self.machine
+        memory = machine.memory
+        register_file = machine.register_file
+        unpack_from = INTEGER_STRUCT.unpack_from
+        pack_into = INTEGER_STRUCT.pack_into
+        size = TYPE_SIZE_MAPPING[op.type]
+        destination = machine.bank_mapping[op.destination]
+
+        # every type has the size of a register
+        def pop() -> None:
+            value = unpack_from(memory, machine.frame_address)[0]
+            machine.frame_address += size
+            pack_into(register_file, destination, value)
+
+        return pop
+
+    def visit_binary_arithmetic(self, op: BinaryArithmetic) -> Handler:
+        register_file = self.machine.register_file
+        compute = self.machine.tooling.alu.compute
+        warn = self.machine.tooling.logger.warn
+        unpack_from = INTEGER_STRUCT.unpack_from
+        pack_into = INTEGER_STRUCT.pack_into
+        func = op.func
+        left = self.machine.bank_mapping[op.left]
+        right = self.machine.bank_mapping[op.right]
+        destination = self.machine.bank_mapping[op.destination]
+
+        def binary_arithmetic() -> None:
+            result, flags = compute(
+                func,
+                unpack_from(register_file, left)[0],
+                unpack_from(register_file, right)[0],
+            )
+
+            # checking for no flags first skips the slower flag lookup
+            if flags and UnitFlags.OVERFLOW in flags:
+                warn("overflow detected")
+
+            pack_into(register_file, destination, result)
+
+        return binary_arithmetic
+
+    def visit_binary_arithmetic_immediate(
+        self,
+        op: BinaryArithmeticImmediate,
+    ) -> Handler:
+        register_file = self.machine.register_file
+        compute = self.machine.tooling.alu.compute
+        warn = self.machine.tooling.logger.warn
+        unpack_from = INTEGER_STRUCT.unpack_from
+        pack_into = INTEGER_STRUCT.pack_into
+        func = op.func
+        immediate = int.from_bytes(op.immediate[-REGISTER_SIZE:])
+        left = self.machine.bank_mapping[op.left]
+        destination = self.machine.bank_mapping[op.destination]
+
+        def binary_arithmetic_immediate() -> None:
+            result, flags = compute(
+                func,
+                unpack_from(register_file, left)[0],
+                immediate,
+            )
+
+            if flags and UnitFlags.OVERFLOW in flags:
+                warn("overflow detected")
+
+            pack_into(register_file, destination, result)
+
+        return binary_arithmetic_immediate
+
+    def visit_unary_arithmetic(self, op: UnaryArithmetic) -> Handler:
+        register_file = self.machine.register_file
+        compute_unary = self.machine.tooling.alu.compute_unary
+        unpack_from = INTEGER_STRUCT.unpack_from
+        pack_into = INTEGER_STRUCT.pack_into
+        func = op.func
+        source = self.machine.bank_mapping[op.source]
+        destination = self.machine.bank_mapping[op.destination]
+
+        def unary_arithmetic() -> None:
+            result, _ = compute_unary(func, unpack_from(register_file, source)[0])
+            pack_into(register_file, destination, result)
+
+        return unary_arithmetic
+
+    def visit_dump_memory(self, op: DumpHeap) -> Handler:
+        return functools.partial(self.machine.visit_dump_memory, op)
+
+    def decode(self, op: MacroOp) -> Handler:
+        return op.accept(self)
+
+
+class IntegerMacroOpDecoder(MacroOpDecoder):
+    """
+    Decodes macro ops into handlers executing them on a machine whose
+    registers are integers.
+
+    Values are only encoded when stored into the heap, and decoded when
+    loaded from it.
+    """
+
+    def visit_load(self, op: Load) -> Handler:
+        heap = self.machine.heap
+        registers = self.machine.registers
+        unpack_from = INTEGER_STRUCT.unpack_from
+        source = op.source * REGISTER_SIZE
+        destination = op.destination
+
+        def load() -> None:
+            registers[destination] = unpack_from(heap, source)[0]
+
+        return load
+
+    def visit_load_immediate(self, op: LoadImmediate) -> Handler:
+        registers = self.machine.registers
+        immediate = int.from_bytes(op.immediate[-REGISTER_SIZE:])
+        destination = op.destination
+
+        def load_immediate() -> None:
+            registers[destination] = immediate
+
+        return load_immediate
+
+    def visit_store(self, op: Store) -> Handler:
+        heap = self.machine.heap
+        registers = self.machine.registers
+        pack_into = INTEGER_STRUCT.pack_into
+        source = op.source
+        destination = op.destination * REGISTER_SIZE
+
+        def store() -> None:
+            pack_into(heap, destination, registers[source])
+
+        return store
+
+    def visit_pop(self, op: Pop) -> Handler:
+        machine = self.machine
+        memory = machine.memory
+        registers = machine.registers
+        unpack_from = INTEGER_STRUCT.unpack_from
+        size = TYPE_SIZE_MAPPING[op.type]
+        destination = op.destination
+
+        def pop() -> None:
+            registers[destination] = unpack_from(memory, machine.frame_address)[0]
+            machine.frame_address += size
+
+        return pop
+
+    def visit_binary_arithmetic(self, op: BinaryArithmetic) -> Handler:
+        registers = self.machine.registers
+        compute = self.machine.tooling.alu.compute
+        warn = self.machine.tooling.logger.warn
+        func = op.func
+        left = op.left
+        right = op.right
+        destination = op.destination
+
+        def binary_arithmetic() -> None:
+            result, flags = compute(func, registers[left], registers[right])
+
+            if flags and UnitFlags.OVERFLOW in flags:
+                warn("overflow detected")
+
+            registers[destination] = result
+
+        return binary_arithmetic
+
+    def visit_binary_arithmetic_immediate(
+        self,
+        op: BinaryArithmeticImmediate,
+    ) -> Handler:
+        registers = self.machine.registers
+        compute = self.machine.tooling.alu.compute
+        warn = self.machine.tooling.logger.warn
+        func = op.func
+        immediate = int.from_bytes(op.immediate[-REGISTER_SIZE:])
+        left = op.left
+        destination = op.destination
+
+        def binary_arithmetic_immediate() -> None:
+            result, flags = compute(func, registers[left], immediate)
+
+            if flags and UnitFlags.OVERFLOW in flags:
+                warn("overflow detected")
+
+            registers[destination] = result
+
+        return binary_arithmetic_immediate
+
+    def visit_unary_arithmetic(self, op: UnaryArithmetic) -> Handler:
+        registers = self.machine.registers
+        compute_unary = self.machine.tooling.alu.compute_unary
+        func = op.func
+        source = op.source
+        destination = op.destination
+
+        def unary_arithmetic() -> None:
+            registers[destination], _ = compute_unary(func, registers[source])
+
+        return unary_arithmetic
@@ -0,0 +1,302 @@
+"""
+Just-in-time compilation of macro ops to Python functions.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+import io
+import struct
+import typing
+
+from marrow.compiler.backend.funcs import BinaryArithmeticFunc
+from marrow.compiler.backend.funcs import UnaryArithmeticFunc
+from marrow.compiler.backend.macro.ops import MacroOpVisitor
+from marrow.endec import INTEGER_FORMAT
+from marrow.endec import INTEGER_MASK
+
+from .constants import REGISTER_SIZE
+
+if typing.TYPE_CHECKING:
+    import types
+
+    from marrow.compiler.backend.macro.ops import BinaryArithmetic
+    from marrow.compiler.backend.macro.ops import BinaryArithmeticImmediate
+    from marrow.compiler.backend.macro.ops import DumpHeap
+    from marrow.compiler.backend.macro.ops import Load
+    from marrow.compiler.backend.macro.ops import LoadImmediate
+    from marrow.compiler.backend.macro.ops import Pop
+    from marrow.compiler.backend.macro.ops import Push
+    from marrow.compiler.backend.macro.ops import StackMacroOp
+    from marrow.compiler.backend.macro.ops import Store
+    from marrow.compiler.backend.macro.ops import StoreImmediate
+    from marrow.compiler.backend.macro.ops import UnaryArithmetic
+    from marrow.compiler.common import MacroOp
+    from marrow.types import MemoryAddress
+    from marrow.types import RegisterNumber
+
+    from .machine import Machine
+
+type CompiledProgram = collections.abc.Callable[[], None]
+
+INTEGER_STRUCT: typing.Final = struct.Struct(INTEGER_FORMAT)
+
+# `{}` are the operands, which are Python expressions of unsigned integers
+BINARY_EXPRESSIONS: typing.Final[dict[BinaryArithmeticFunc, str]] = {
+    BinaryArithmeticFunc.ADD: "{} + {}",
+    BinaryArithmeticFunc.SUB: f"({{}} - {{}}) & {INTEGER_MASK:#x}",
+    BinaryArithmeticFunc.MUL: "{} * {}",
+    BinaryArithmeticFunc.DIV: "{0} // {1} if {1} else 0",
+    BinaryArithmeticFunc.MOD: "{0} % {1} if {1} else 0",
+}
+UNARY_EXPRESSIONS: typing.Final[dict[UnaryArithmeticFunc, str]] = {
+    UnaryArithmeticFunc.NEG: f"-{{}} & {INTEGER_MASK:#x}",
+    UnaryArithmeticFunc.POS: "{}",
+}
+# the runtime reports the overflows of these functions
+OVERFLOWING_FUNCS: typing.Final = frozenset(
+    {BinaryArithmeticFunc.ADD, BinaryArithmeticFunc.MUL},
+)
+
+
+@functools.lru_cache(maxsize=16)
+def compile_source(source: str) -> types.CodeType:
+    """
+    Compile the source of a program, reusing the code of the last programs.
+
+    Compiling is the costly part of the translation, so a program run again
+    is only compiled once.
+    """
+
+    return compile(source, "<marrow jit>", "exec")
+
+
+class JITCompiler(MacroOpVisitor[None]):
+    """
+    Compiles straight-line macro ops into a Python function running them on a
+    machine.
+
+    Registers and heap slots are local integer variables of the function. The
+    ones read before being written are unpacked from the machine when it
+    starts, and the ones written are packed back when it returns. The heap
+    slots are also packed back before a memory dump.
+
+    The function has the same effect on the heap and the registers as the
+    interpreter, and reports the same overflows. It does not track register
+    accesses, nor update the flags of the ALU.
+    """
+
+    def __init__(self, machine: Machine) -> None:
+        self.machine: typing.Final = machine
+
+        self.body = io.StringIO()
+        self.ops: list[MacroOp | StackMacroOp] = []
+
+        self.loaded_registers: set[RegisterNumber] = set()
+        self.written_registers: set[RegisterNumber] = set()
+        self.loaded_slots: set[MemoryAddress] = set()
+        self.written_slots: set[MemoryAddress] = set()
+        # the slots written since they were last packed back
+        self.dirty_slots: set[MemoryAddress] = set()
+
+    def emit(self, line: str) -> None:
+        print(f"    {line}", file=self.body)
+
+    def read_register(self, number: RegisterNumber) -> str:
+        if number not in self.written_registers:
+            self.loaded_registers.add(number)
+
+        return f"r{number}"
+
+    def write_register(self, number: RegisterNumber) -> str:
+        self.written_registers.add(number)
+
+        return f"r{number}"
+
+    def read_slot(self, address: MemoryAddress) -> str:
+        if address not in self.written_slots:
+            self.loaded_slots.add(address)
+
+        return f"h{address}"
+
+    def write_slot(self, address: MemoryAddress) -> str:
+        self.written_slots.add(address)
+        self.dirty_slots.add(address)
+
+        return f"h{address}"
+
+    def get_op_reference(self, op: MacroOp | StackMacroOp) -> str:
+        self.ops.append(op)
+
+        return f"ops[{len(self.ops) - 1}]"
+
+    def get_register_location(self, number: RegisterNumber) -> str:
+        """Python expression of the register in the machine."""
+
+        if self.machine.integer_registers:
+            return f"registers[{number}]"
+
+        offset = self.machine.bank_mapping[number]
+
+        return f"unpack_from(registers, {offset})[0]"
+
+    def get_register_packing(self, number: RegisterNumber) -> str:
+        """Python statement writing back the register to the machine."""
+
+        if self.machine.integer_registers:
+            return f"registers[{number}] = r{number}"
+
+        offset = self.machine.bank_mapping[number]
+
+        return f"pack_into(registers, {offset}, r{number})"
+
+    def emit_overflow_check(self, variable: str) -> None:
+        self.emit(f"if {variable} > {INTEGER_MASK:#x}:")
+        self.emit('    warn("overflow detected")')
+        self.emit(f"    {variable} &= {INTEGER_MASK:#x}")
+
+    def emit_slots_packing(self) -> None:
+        for address in sorted(self.dirty_slots):
+            self.emit(f"pack_into(heap, {address * REGISTER_SIZE}, h{address})")
+
+        self.dirty_slots.clear()
+
+    def visit_load(self, op: Load) -> None:
+        source = self.read_slot(op.source)
+        self.emit(f"{self.write_register(op.destination)} = {source}")
+
+    def visit_load_immediate(self, op: LoadImmediate) -> None:
+        immediate = int.from_bytes(op.immediate[-REGISTER_SIZE:])
+        self.emit(f"{self.write_register(op.destination)} = {immediate:#x}")
+
+    def visit_store(self, op: Store) -> None:
+        source = self.read_register(op.source)
+        self.emit(f"{self.write_slot(op.destination)} = {source}")
+
+    def visit_store_immediate(self, op: StoreImmediate) -> None:
+        immediate = int.from_bytes(op.immediate[-REGISTER_SIZE:])
+        self.emit(f"{self.write_slot(op.destination)} = {immediate:#x}")
+
+    def visit_push(self, op: Push) -> None:
+        self.emit(f"push({self.get_op_reference(op)})")
+
+    def visit_pop(self, op: Pop) -> None:
+        location = self.get_register_location(op.destination)
+
+        self.emit(f"pop({self.get_op_reference(op)})")
+        self.emit(f"{self.write_register(op.destination)} = {location}")
+
+    def emit_binary_arithmetic(
+        self,
+        func: BinaryArithmeticFunc,
+        destination: RegisterNumber,
+        left: str,
+        right: str,
+    ) -> None:
+        variable = self.write_register(destination)
+
+        self.emit(f"{variable} = {BINARY_EXPRESSIONS[func].format(left, right)}")
+
+        if func in OVERFLOWING_FUNCS:
+            self.emit_overflow_check(variable)
+
+    def visit_binary_arithmetic(self, op: BinaryArithmetic) -> None:
+        left = self.read_register(op.left)
+        right = self.read_register(op.right)
+
+        self.emit_binary_arithmetic(op.func, op.destination, left, right)
+
+    def visit_binary_arithmetic_immediate(self, op: BinaryArithmeticImmediate) -> None:
+        left = self.read_register(op.left)
+        right = f"{int.from_bytes(op.immediate[-REGISTER_SIZE:]):#x}"
+
+        self.emit_binary_arithmetic(op.func, op.destination, left, right)
+
+    def visit_unary_arithmetic(self, op: UnaryArithmetic) -> None:
+        source = self.read_register(op.source)
+        variable = self.write_register(op.destination)
+
+        self.emit(f"{variable} = {UNARY_EXPRESSIONS[op.func].format(source)}")
+
+    def visit_dump_memory(self, op: DumpHeap) -> None:
+        self.emit_slots_packing()
+        self.emit(f"dump_memory({self.get_op_reference(op)})")
+
+    def translate(self, ops: collections.abc.Iterable[MacroOp]) -> str:
+        """
+        Parameters
+        ----------
+        ops : Iterable[MacroOp]
+
+        Returns
+        -------
+        str
+            The source of the `program` function running the ops.
+        """
+
+        self.body = io.StringIO()
+        self.ops = []
+        self.loaded_registers.clear()
+        self.written_registers.clear()
+        self.loaded_slots.clear()
+        self.written_slots.clear()
+        self.dirty_slots.clear()
+
+        for op in ops:
+            op.accept(self)
+
+        self.emit_slots_packing()
+
+        for number in sorted(self.written_registers):
+            self.emit(self.get_register_packing(number))
+
+        source = io.StringIO()
+
+        print("def program():", file=source)
+
+        for number in sorted(self.loaded_registers):
+            location = self.get_register_location(number)
+            print(f"    r{number} = {location}", file=source)
+
+        for address in sorted(self.loaded_slots):
+            offset = address * REGISTER_SIZE
+            print(f"    h{address} = unpack_from(heap, {offset})[0]", file=source)
+
+        source.write(self.body.getvalue())
+        print("    return", file=source)
+
+        return source.getvalue()
+
+    def compile(self, ops: collections.abc.Iterable[MacroOp]) -> CompiledProgram:
+        """
+        Parameters
+        ----------
+        ops : Iterable[MacroOp]
+
+        Returns
+        -------
+        CompiledProgram
+            The function running the ops on the machine.
+        """
+
+        source = self.translate(ops)
+        namespace: dict[str, typing.Any] = {
+            "heap": self.machine.heap,
+            "registers": (
+                self.machine.registers
+                if self.machine.integer_registers
+                else self.machine.register_file
+            ),
+            "ops": self.ops,
+            "pack_into": INTEGER_STRUCT.pack_into,
+            "unpack_from": INTEGER_STRUCT.unpack_from,
+            "warn": self.machine.tooling.logger.warn,
+            "push": self.machine.visit_push,
+            "pop": self.machine.visit_pop,
+            "dump_memory": self.machine.visit_dump_memory,
+        }
+
+        exec(compile_source(source), namespace)
+
+        return namespace["program"]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import collections
+import gc
 import io
 import itertools
 import time
+import tracemalloc
 import typing
 
 from marrow.compiler.backend.macro.ops import MacroOpVisitor
@@ -13,18 +16,22 @@ from marrow.types import TYPE_SIZE_MAPPING
 from marrow.types import ImmediateType
 from marrow.types import RuntimeType
 
-from .alu.op import BINOP_MAPPING
-from .alu.op import UNOP_MAPPING
+from .constants import HEAP_SIZE
 from .constants import REGISTER_COUNT
 from .constants import REGISTER_INDEXES
 from .constants import REGISTER_SIZE
+from .dispatch import IntegerMacroOpDecoder
+from .dispatch import MacroOpDecoder
+from .jit import JITCompiler
 from .rat import ReadAccess
 from .rat import WriteAccess
 
 if typing.TYPE_CHECKING:
     from marrow.compiler.backend.macro.ops import BinaryArithmetic
+    from marrow.compiler.backend.macro.ops import BinaryArithmeticImmediate
     from marrow.compiler.backend.macro.ops import DumpHeap
     from marrow.compiler.backend.macro.ops import Load
+    from marrow.compiler.backend.macro.ops import LoadImmediate
     from marrow.compiler.backend.macro.ops import Push
     from marrow.compiler.backend.macro.ops import Store
     from marrow.compiler.backend.macro.ops import StoreImmediate
@@ -36,24 +43,70 @@ if typing.TYPE_CHECKING:
     from marrow.types import MemoryAddress
     from marrow.types import RegisterNumber
 
+    from .dispatch import Handler
     from .rat import Access
 
 
+def trim(payload: bytearray, size: int) -> bytearray | memoryview:
+    """
+    Parameters
+    ----------
+    payload : bytearray
+    size : int
+
+    Returns
+    -------
+    bytearray | memoryview
+        The last `size` bytes of the payload, which are not copied.
+    """
+
+    payload_size = len(payload)
+
+    if payload_size == size:
+        return payload
+
+    return memoryview(payload)[payload_size - size :]
+
+
 # TODO: interrupts & exceptions
 class Machine(MacroOpVisitor[None]):
-    HEAP_SIZE = 0x10000
+    HEAP_SIZE = HEAP_SIZE
     SECTION_SIZE = 0x100
     SECTION_COUNT = 0x100
     MEMORY_SIZE = SECTION_SIZE * SECTION_COUNT
 
-    def __init__(self, tooling: GlobalTooling) -> None:
+    def __init__(
+        self,
+        tooling: GlobalTooling,
+        *,
+        jit: bool = False,
+        integer_registers: bool = False,
+        profile_memory: bool = False,
+    ) -> None:
         self.register_file = bytearray(REGISTER_SIZE * REGISTER_COUNT)
         self.bank_mapping: dict[RegisterNumber, int] = {
             index: index * REGISTER_SIZE for index in REGISTER_INDEXES
         }
+        # whether registers are held by `registers` as integers, instead of
+        # by `register_file`, and only encoded when read as bytes
+        self.integer_registers: typing.Final = integer_registers
+        self.registers = [0] * REGISTER_COUNT
 
         self.instruction_count = 0
         self.instructions: list[MacroOp] = []
+        # the decoded instructions, run outside of debug mode
+        self.handlers: list[Handler] = []
+        self.decoder = (
+            IntegerMacroOpDecoder(self) if integer_registers else MacroOpDecoder(self)
+        )
+        # whether instructions are compiled to Python outside of debug mode
+        self.jit: typing.Final = jit
+        self.jit_compiler = JITCompiler(self)
+        # whether the memory allocated by each instruction is measured
+        # outside of debug mode, into `allocations` and `allocation_counts`
+        self.profile_memory: typing.Final = profile_memory
+        self.allocations: collections.Counter[str] = collections.Counter()
+        self.allocation_counts: collections.Counter[str] = collections.Counter()
 
         # the stack grows backwards!
         self.stack_address = Machine.MEMORY_SIZE
@@ -63,6 +116,7 @@ class Machine(MacroOpVisitor[None]):
 
         # for now, it's separated
         self.heap = bytearray(Machine.HEAP_SIZE)
+        self.heap_view = memoryview(self.heap)
 
         self.access_tracking: list[Access] = []
         self.tooling = RuntimeTooling.from_global(tooling)
@@ -74,6 +128,10 @@ class Machine(MacroOpVisitor[None]):
 
     def get_register_raw(self, number: RegisterNumber) -> bytearray:
         self.access_tracking.append(ReadAccess(number))
+
+        if self.integer_registers:
+            return self.tooling.endec.encode_integer(self.registers[number])
+
         index = self.bank_mapping[number]
 
         return self.register_file[index : index + REGISTER_SIZE]
@@ -85,17 +143,18 @@ class Machine(MacroOpVisitor[None]):
 
     def set_register_raw(self, number: RegisterNumber, value: bytearray) -> None:
         self.access_tracking.append(WriteAccess(number, value))
+
+        if self.integer_registers:
+            self.registers[number] = int.from_bytes(trim(value, REGISTER_SIZE))
+            return
+
         index = self.bank_mapping[number]
 
-        self.register_file[index : index + REGISTER_SIZE] = value
+        self.register_file[index : index + REGISTER_SIZE] = trim(value, REGISTER_SIZE)
 
     def push(self, value: bytearray, size: int, /) -> None:
-        value_size = len(value)
-
         self.frame_address -= size
-        self.memory[self.frame_address : self.frame_address + size] = value[
-            value_size - size : value_size
-        ]
+        self.memory[self.frame_address : self.frame_address + size] = trim(value, size)
 
     def pop(self, size: int, /) -> bytearray:
         data = self.memory[self.frame_address : self.frame_address + size]
@@ -120,11 +179,7 @@ class Machine(MacroOpVisitor[None]):
         if size <= 0:
             return
 
-        payload_size = len(payload)
-
-        self.heap[address : address + size] = payload[
-            payload_size - size : payload_size
-        ]
+        self.heap[address : address + size] = trim(payload, size)
 
     def visit_load(self, op: Load) -> None:
         self.set_register_raw(
@@ -132,6 +187,9 @@ class Machine(MacroOpVisitor[None]):
             self.get_heap_raw(op.source * REGISTER_SIZE, REGISTER_SIZE),
         )
 
+    def visit_load_immediate(self, op: LoadImmediate) -> None:
+        self.set_register_raw(op.destination, op.immediate)
+
     def visit_store(self, op: Store) -> None:
         self.set_heap_raw(
             op.destination * REGISTER_SIZE,
@@ -154,22 +212,33 @@ class Machine(MacroOpVisitor[None]):
         self.set_register_raw(op.destination, data)
 
     def visit_binary_arithmetic(self, op: BinaryArithmetic) -> None:
-        left = self.get_register_raw(op.left)
-        right = self.get_register_raw(op.right)
+        left = self.tooling.endec.decode_integer(self.get_register_raw(op.left))
+        right = self.tooling.endec.decode_integer(self.get_register_raw(op.right))
+
+        result, flags = self.tooling.alu.compute(op.func, left, right)
+
+        if UnitFlags.OVERFLOW in flags:
+            self.tooling.logger.warn("overflow detected")
 
-        result = self.tooling.alu.execute(BINOP_MAPPING[op.func](left, right))
+        self.set_register_raw(op.destination, self.tooling.endec.encode_integer(result))
 
-        if UnitFlags.OVERFLOW in self.tooling.alu.flags:
+    def visit_binary_arithmetic_immediate(self, op: BinaryArithmeticImmediate) -> None:
+        left = self.tooling.endec.decode_integer(self.get_register_raw(op.left))
+        right = self.tooling.endec.decode_integer(op.immediate)
+
+        result, flags = self.tooling.alu.compute(op.func, left, right)
+
+        if UnitFlags.OVERFLOW in flags:
             self.tooling.logger.warn("overflow detected")
 
-        self.set_register_raw(op.destination, result)
+        self.set_register_raw(op.destination, self.tooling.endec.encode_integer(result))
 
     def visit_unary_arithmetic(self, op: UnaryArithmetic) -> None:
-        right = self.get_register_raw(op.source)
+        right = self.tooling.endec.decode_integer(self.get_register_raw(op.source))
 
-        result = self.tooling.alu.execute(UNOP_MAPPING[op.func](right))
+        result, _ = self.tooling.alu.compute_unary(op.func, right)
 
-        self.set_register_raw(op.destination, result)
+        self.set_register_raw(op.destination, self.tooling.endec.encode_integer(result))
 
     def visit_dump_memory(self, op: DumpHeap) -> None:
         self.tooling.logger.debug(self._generate_dump_memory_log(op.section_id))
@@ -187,7 +256,7 @@ class Machine(MacroOpVisitor[None]):
     def _generate_dump_memory_log(self, section_id: int) -> str:
         buffer = io.StringIO()
         start = section_id * Machine.SECTION_SIZE
-        section = self.heap[start : start + Machine.SECTION_SIZE]
+        section = self.heap_view[start : start + Machine.SECTION_SIZE]
 
         print(f"memory dump (section {section_id:#x})", file=buffer)
 
@@ -211,6 +280,28 @@ class Machine(MacroOpVisitor[None]):
 
         return buffer.getvalue()
 
+    def _generate_memory_profile_log(self) -> str:
+        buffer = io.StringIO()
+
+        print("memory profile", file=buffer)
+
+        if not self.allocation_counts:
+            print("• none", file=buffer)
+
+        for name, count in sorted(self.allocation_counts.items()):
+            print(
+                f"• {name}: {count} ops, {self.allocations[name] / count:.1f} B/op",
+                file=buffer,
+            )
+
+        total_count = self.allocation_counts.total()
+
+        if total_count:
+            average = self.allocations.total() / total_count
+            print(f"• total: {total_count} ops, {average:.1f} B/op", file=buffer)
+
+        return buffer.getvalue().removesuffix("\n")
+
     def visit_op(self, op: MacroOp) -> None:
         op.accept(self)
 
@@ -223,19 +314,106 @@ class Machine(MacroOpVisitor[None]):
     def load_bytecode(self, bytecode: Bytecode) -> None:
         self.instructions.extend(bytecode)
 
-    def execute(self, bytecode: Bytecode, *, debug: bool = False) -> None:
-        time_start = time.perf_counter()
+    def decode_instructions(self) -> None:
+        """Decode the loaded instructions that have not been decoded yet."""
 
-        self.load_bytecode(bytecode)
-        self.jump_relative(bytecode.entry_point)
+        decode = self.decoder.decode
+        pending = itertools.islice(self.instructions, len(self.handlers), None)
+
+        # decoding creates lots of objects that are kept, which would trigger
+        # collections scanning them again and again
+        is_collecting = gc.isenabled()
+        gc.disable()
+
+        try:
+            self.handlers.extend(decode(op) for op in pending)
+        finally:
+            if is_collecting:
+                gc.enable()
+
+    def run_visiting(self) -> None:
+        """Run the loaded instructions by visiting them, tracking register accesses."""
 
         while self.instruction_count < len(self.instructions):
             self.visit_op(self.instructions[self.instruction_count])
 
             self.instruction_count += 1
 
+    def run_threaded(self) -> None:
+        """Run the loaded instructions by calling their handlers in a row."""
+
+        self.decode_instructions()
+
+        for handler in itertools.islice(self.handlers, self.instruction_count, None):
+            handler()
+
+        self.instruction_count = len(self.handlers)
+
+    def run_profiled(self) -> None:
+        """
+        Run the loaded instructions as threaded code, one at a time, measuring
+        the memory each allocates. Memory is traced while it runs, which slows
+        it down.
+        """
+
+        self.decode_instructions()
+
+        is_tracing = tracemalloc.is_tracing()
+
+        if not is_tracing:
+            tracemalloc.start()
+
+        try:
+            for index in range(self.instruction_count, len(self.handlers)):
+                name = type(self.instructions[index]).__name__
+
+                memory_start, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+
+                self.handlers[index]()
+
+                _, memory_peak = tracemalloc.get_traced_memory()
+
+                self.allocations[name] += memory_peak - memory_start
+                self.allocation_counts[name] += 1
+        finally:
+            if not is_tracing:
+                tracemalloc.stop()
+
+        self.instruction_count = len(self.handlers)
+
+    def run_compiled(self) -> None:
+        """Run the loaded instructions by compiling them to a Python function."""
+
+        pending = itertools.islice(self.instructions, self.instruction_count, None)
+        program = self.jit_compiler.compile(pending)
+
+        program()
+
+        self.instruction_count = len(self.instructions)
+
+    def execute(self, bytecode: Bytecode, *, debug: bool = False) -> None:
+        time_start = time.perf_counter()
+
+        self.load_bytecode(bytecode)
+        self.jump_relative(bytecode.entry_point)
+
+        # the register access log is only shown in debug mode
+        if debug:
+            self.run_visiting()
+        elif self.profile_memory:
+            self.allocations.clear()
+            self.allocation_counts.clear()
+            self.run_profiled()
+        elif self.jit:
+            self.run_compiled()
+        else:
+            self.run_threaded()
+
         time_end = time.perf_counter()
 
         if debug:
             self.tooling.logger.debug(f"execution time: {time_end - time_start:.4f}s")
             self.tooling.logger.debug(self._generate_register_access_log())
+        elif self.profile_memory:
+            self.tooling.logger.debug(self._generate_memory_profile_log())
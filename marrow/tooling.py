@@ -3,8 +3,12 @@ import typing
 import attrs
 
 from marrow.compiler.backend.macro.generator import MacroOpGenerator
+from marrow.compiler.backend.macro.peephole import PeepholeOptimizer
 from marrow.compiler.frontend.ptsc import ParseTreeSanityChecker
+from marrow.compiler.middleend.SSAIR.folding import ConstantFolder
 from marrow.compiler.middleend.SSAIR.generator import IRGenerator
+from marrow.compiler.middleend.SSAIR.liveness import DeadCodeEliminator
+from marrow.compiler.middleend.SSAIR.numbering import CommonSubexpressionEliminator
 from marrow.compiler.renderers.macroop import MacroOpRenderer
 from marrow.compiler.renderers.parse_tree import ParseTreeRenderer
 from marrow.compiler.renderers.rvalue import RValueRenderer
@@ -28,8 +32,12 @@ class CompilerTooling(GlobalTooling):
     sanity_checker: ParseTreeSanityChecker
     parse_tree_renderer: ParseTreeRenderer
     ir_generator: IRGenerator
+    constant_folder: ConstantFolder
+    cse: CommonSubexpressionEliminator
+    dce: DeadCodeEliminator
     rvalue_renderer: RValueRenderer
     macro_op_generator: MacroOpGenerator
+    peephole_optimizer: PeepholeOptimizer
     macro_op_renderer: MacroOpRenderer
 
     @classmethod
@@ -40,8 +48,12 @@ class CompilerTooling(GlobalTooling):
             ParseTreeSanityChecker(),
             ParseTreeRenderer(),
             IRGenerator(),
+            ConstantFolder(tooling),
+            CommonSubexpressionEliminator(),
+            DeadCodeEliminator(),
             RValueRenderer(),
             MacroOpGenerator(tooling),
+            PeepholeOptimizer(),
             MacroOpRenderer(),
         )
 
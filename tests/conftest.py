@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import collections.abc
+import io
+import pathlib
+import random
+
+import attrs
+import pytest
+
+from marrow.compiler import Compiler
+from marrow.compiler import CompilerOptions
+from marrow.compiler.common import Bytecode
+from marrow.runtime.machine import Machine
+from marrow.tooling import GlobalTooling
+
+EXAMPLES_PATH = pathlib.Path(__file__).parent.parent / "examples"
+
+
+def generate_expression(rng: random.Random, depth: int = 0) -> str:
+    """
+    Parameters
+    ----------
+    rng : random.Random
+        The generator the expression is drawn from.
+    depth : int
+        The nesting depth of the expression, bounding its size.
+
+    Returns
+    -------
+    str
+        A random integer expression, mixing every operator.
+    """
+
+    roll = rng.random()
+
+    if depth > 4 or roll < 0.3:
+        return str(rng.choice([0, 1, 2, 3, 7, 255, 2**63, 2**64 - 1]))
+
+    if roll < 0.45:
+        return f"({generate_expression(rng, depth + 1)})"
+
+    if roll < 0.6:
+        return rng.choice("+-") + generate_expression(rng, depth + 1)
+
+    left = generate_expression(rng, depth + 1)
+    right = generate_expression(rng, depth + 1)
+
+    return f"{left} {rng.choice('+-*/%')} {right}"
+
+
+def generate_source(seed: int) -> str:
+    """
+    Parameters
+    ----------
+    seed : int
+
+    Returns
+    -------
+    str
+        A module of random integer statements, the same for a given seed.
+    """
+
+    rng = random.Random(seed)
+    statements = [generate_expression(rng) for _ in range(8)]
+
+    return "mod in\n" + "".join(f"    {stmt};\n" for stmt in statements) + "end\n"
+
+
+SOURCES: dict[str, str] = {
+    "hello": (EXAMPLES_PATH / "hello.marrow").read_text(),
+    "arithmetic": "mod in 7 / 2; 7 % 3; 6 - 9; 3 * 4; end",
+    "unary": "mod in -5; +5; -(3 - 5); -(-7); end",
+    "overflow": "mod in 18446744073709551615 + 1; 0 - 1; 9223372036854775808 * 3; end",
+    "division by zero": "mod in 1 / 0; 5 % 0; end",
+    "repetition": "mod in 2 * (3 + 4) - (3 + 4) * 2; 3 + 4; 1 + 2; 1 + 2; end",
+    "nesting": "mod in ((((1 + 2) * 3) - 4) / 5) % 6; end",
+    **{f"generated {seed}": generate_source(seed) for seed in range(10)},
+}
+
+
+@attrs.frozen
+class MachineState:
+    """
+    State of the machine after running a program.
+
+    Attributes
+    ----------
+    heap : bytes
+    registers : bytes
+        The register file.
+    warnings : list[str]
+        The warnings logged while running, e.g. on overflows.
+    """
+
+    heap: bytes
+    registers: bytes
+    warnings: list[str]
+
+
+type SourceRunner = collections.abc.Callable[[str, CompilerOptions, bool], MachineState]
+
+
+@pytest.fixture(params=list(SOURCES.values()), ids=list(SOURCES))
+def source(request: pytest.FixtureRequest) -> str:
+    return request.param
+
+
+@pytest.fixture
+def run_source(monkeypatch: pytest.MonkeyPatch) -> SourceRunner:
+    """
+    Returns
+    -------
+    SourceRunner
+        A function compiling a source with the given options, then running it
+        on a new machine, with or without the JIT compiler.
+    """
+
+    def run(source: str, options: CompilerOptions, jit: bool) -> MachineState:
+        tooling = GlobalTooling.new(verbose=False)
+        compiler = Compiler(tooling, False, False, options)
+
+        assert compiler.compile(io.StringIO(source)) == 0
+
+        machine = Machine(tooling, jit=jit)
+        warnings: list[str] = []
+
+        # the warnings of the compiler are not kept, only those of the machine
+        with monkeypatch.context() as patch:
+            patch.setattr(tooling.logger, "warn", warnings.append)
+            machine.execute(Bytecode.from_resources(compiler.resources))
+
+        return MachineState(
+            bytes(machine.heap),
+            bytes(machine.register_file),
+            warnings,
+        )
+
+    return run
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import typing
+
+import pytest
+
+from marrow.compiler import CompilerOptions
+
+if typing.TYPE_CHECKING:
+    from .conftest import SourceRunner
+
+
+@pytest.mark.parametrize("optimization_level", [0, 1, 2])
+def test_jit_matches_interpreter(
+    source: str,
+    optimization_level: int,
+    run_source: SourceRunner,
+) -> None:
+    options = CompilerOptions(optimization_level=optimization_level)
+
+    assert run_source(source, options, True) == run_source(source, options, False)
+
+
+def test_jit_reports_overflows(run_source: SourceRunner) -> None:
+    options = CompilerOptions(optimization_level=0)
+    state = run_source("mod in 18446744073709551615 + 1; end", options, True)
+
+    assert state.warnings == ["overflow detected"]
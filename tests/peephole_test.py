@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import typing
+
+import pytest
+
+from marrow.compiler import CompilerOptions
+
+if typing.TYPE_CHECKING:
+    from .conftest import SourceRunner
+
+
+@pytest.mark.parametrize("fold_constants", [True, False])
+@pytest.mark.parametrize("optimization_level", [1, 2])
+def test_peephole_keeps_end_state(
+    source: str,
+    optimization_level: int,
+    fold_constants: bool,
+    run_source: SourceRunner,
+) -> None:
+    states = [
+        run_source(
+            source,
+            CompilerOptions(
+                optimization_level=optimization_level,
+                fold_constants=fold_constants,
+                peephole=peephole,
+            ),
+            False,
+        )
+        for peephole in (True, False)
+    ]
+
+    assert states[0] == states[1]
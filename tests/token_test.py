@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from marrow.compiler.common import TokenType
+from marrow.compiler.frontend.token import LineIndex
+from marrow.compiler.frontend.token import Span
+from marrow.compiler.options import TOKENIZER_MAPPING
+
+
+def test_line_index_follows_growing_contents() -> None:
+    contents = io.StringIO()
+    lines = LineIndex(contents)
+
+    contents.write("mod in\n    1 +")
+    assert lines.get_position(11) == (2, 5)
+
+    # the second line is continued, and a third one is started
+    contents.write(" 2;\nend")
+    assert lines.get_position(18) == (3, 1)
+    assert lines.get_lines(1, 3) == ["mod in\n", "    1 + 2;\n", "end"]
+    assert lines.get_lines(2, 5) == ["    1 + 2;\n", "end"]
+
+    contents.write("\n")
+    assert lines.get_lines(3, 4) == ["end\n", ""]
+
+
+@pytest.mark.parametrize("tokenizer_name", list(TOKENIZER_MAPPING))
+def test_compact_stream_matches_tokenizer(tokenizer_name: str) -> None:
+    source = "mod in\n    1 + 2.5;\n    -(3 % 4) $ 1;\nend\n"
+    tokenizer_type = TOKENIZER_MAPPING[tokenizer_name]
+
+    tokens: list[tuple[TokenType, str, Span]] = []
+
+    for token in tokenizer_type(io.StringIO(source)).run():
+        tokens.append((token.type, token.lexeme, token.span))
+
+        if token.type is TokenType.EOF:
+            break
+
+    stream = tokenizer_type(io.StringIO(source)).run_compact()
+
+    # iterating over the stream would yield end-of-file tokens forever
+    compact_tokens = [stream[index] for index in range(len(stream))]
+
+    assert [
+        (token.type, token.lexeme, token.span) for token in compact_tokens
+    ] == tokens